@@ -97,7 +97,7 @@ def init_session_state(default_data_subdirectory_name:str ='data', reset_session
         return False
    
 
-st.cache_data()
+@st.cache_data(show_spinner=False)
 def load_logos():
     """
     Loads logo paths from a TOML configuration file.
@@ -108,7 +108,7 @@ def load_logos():
     Note:
     The function relies on a configuration file named 'logos.toml' which is expected to be located in 
     the 'config' subdirectory of the main application directory. This TOML file contains paths to various 
-    logo images used throughout the application. The function uses caching via `st.cache_data()` to ensure 
+    logo images used throughout the application. The function uses caching via `@st.cache_data` to ensure 
     efficient loading of the logos without unnecessary file reads on every invocation.
     """
 
@@ -1,5 +1,10 @@
 import streamlit as st
 
+# Option label -> index, built once at import
+SHELLS_OPTIONS = {'no':0, 'förekommande':1, 'måttligt':2,'rikligt':3}
+KRYPSPAR_OPTIONS = {'no':0, 'förekommande':1, 'måttligt > 10%':2,'rikligt > 50%':3}
+FRAME_FLAGS_OPTIONS = {'Bra bildkvalitet': 0, 'Dålig bildkvalitet': 1, 'Dålig sikt/vattenkvalitet':2}
+
 def SGU_custom_options(FRAME_INTERPRETATION:dict)->dict:
     """
     Provides a Streamlit-based UI for the user to select and input custom options for a survey frame.
@@ -32,20 +37,18 @@ def SGU_custom_options(FRAME_INTERPRETATION:dict)->dict:
 
     col1, col2 = st.columns([1,1])
     with col1:
-        shells_options = {'no':0, 'förekommande':1, 'måttligt':2,'rikligt':3}
         key_shells = FRAME_INTERPRETATION.get('CUSTOM_OPTIONS', {}).get('shells', 'no')
         shells = st.selectbox(
             label='Limecola baltica shell', 
-            options=shells_options,            
-            index=shells_options.get(key_shells, 0)            
+            options=SHELLS_OPTIONS,            
+            index=SHELLS_OPTIONS.get(key_shells, 0)            
              )
         
-        krypspar_options={'no':0, 'förekommande':1, 'måttligt > 10%':2,'rikligt > 50%':3}
         key_krypspar =  FRAME_INTERPRETATION.get('CUSTOM_OPTIONS', {}).get('krypspar', 'no')
         krypspar = st.selectbox(
             label='Krypspår', 
-            options={'no':0, 'förekommande':1, 'måttligt > 10%':2,'rikligt > 50%':3},
-            index=krypspar_options.get(key_krypspar, 0)
+            options=KRYPSPAR_OPTIONS,
+            index=KRYPSPAR_OPTIONS.get(key_krypspar, 0)
             )
         
         sandwave = st.number_input(
@@ -58,14 +61,13 @@ def SGU_custom_options(FRAME_INTERPRETATION:dict)->dict:
     with col2:
         if 'CUSTOM_OPTIONS' in FRAME_INTERPRETATION:
 
-            frame_flags_options = {'Bra bildkvalitet': 0, 'Dålig bildkvalitet': 1, 'Dålig sikt/vattenkvalitet':2}
             key_flag = FRAME_INTERPRETATION.get('CUSTOM_OPTIONS', {}).get('frame_flags', 'Bra bildkvalitet')
             
             frame_flags = st.selectbox(
                 label = 'flags', 
-                options=frame_flags_options,
+                options=FRAME_FLAGS_OPTIONS,
                 placeholder='Select quality flags',
-                index=frame_flags_options.get(key_flag, 0),
+                index=FRAME_FLAGS_OPTIONS.get(key_flag, 0),
                 )
                     
                 
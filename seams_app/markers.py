@@ -111,6 +111,49 @@ def add_random_noise_to_polygon_centroid(polygon:Polygon, noise_percent: float)-
     return centroid
 
 
+def _markers_grid_coords(
+    min_x:float, 
+    min_y:float, 
+    max_x:float, 
+    max_y:float, 
+    n_rows:int = 3, 
+    noise_percent: float = None,
+    )->np.ndarray:
+    """
+    Computes the (x, y) centroids of the 3/4 alternating column grid as a single NumPy array.
+
+    Args:
+        min_x, min_y, max_x, max_y (float): 
+            Bounds of the area to divide.
+        
+        n_rows (int, optional): 
+            Number of rows. Even-indexed rows have 3 columns, odd-indexed rows have 4. Defaults to 3.
+        
+        noise_percent (float, optional): 
+            Same meaning as in `add_random_noise_to_polygon_centroid`, the noise is applied only when it is in (0, 1]. Defaults to None.
+
+    Returns:
+        np.ndarray: 
+            An (N, 2) array of centroid coordinates in row-major order.
+    """
+    row_height = (max_y - min_y) / n_rows
+    n_cols = np.where(np.arange(n_rows) % 2 == 0, 3, 4)
+    
+    row_index = np.repeat(np.arange(n_rows), n_cols)
+    col_index = np.arange(row_index.size) - np.repeat(np.cumsum(n_cols) - n_cols, n_cols)
+    col_width = (max_x - min_x) / np.repeat(n_cols, n_cols)
+
+    x = min_x + (col_index + 0.5) * col_width
+    y = min_y + (row_index + 0.5) * row_height
+
+    if noise_percent is not None and (noise_percent > 0 and noise_percent <= 1.0):
+        # salt and pepper noise as a percentage of the half cell size, i.e. the centroid to min bound distance
+        x = x + np.random.uniform(-1.0, 1.0, x.size) * noise_percent * col_width / 2
+        y = y + np.random.uniform(-1.0, 1.0, y.size) * noise_percent * row_height / 2
+
+    return np.column_stack((x, y))
+
+
 def markers_grid(
     bbox:Polygon, 
     n_rows:int = 3, 
@@ -146,59 +189,17 @@ def markers_grid(
     Notes:
         The function operates by first dividing the bounding box into rows. Each row is then divided into columns: even-indexed 
         rows are divided into 3 columns, and odd-indexed rows are divided into 4 columns. The centroids of these columns are 
-        then computed and optionally perturbed with random noise, if enable_random is set to True.
+        then computed and optionally perturbed with random noise, if enable_random is set to True. The coordinates are computed 
+        in a single vectorized pass by `_markers_grid_coords`, only the returned centroids are wrapped as shapely Points.
     """
 
-    # Calculate the width and height of the polygon
     min_x, min_y, max_x, max_y = bbox.bounds
-    row_width = max_x - min_x 
-    height = max_y - min_y
-
-    # Divide the polygon into rows
-    row_height = height / n_rows
-    rows = []
-
-    for i in range(n_rows):
-        y0 = min_y + i * row_height
-        y1 = y0 + row_height
-        rows.append(Polygon([(min_x, y0), (max_x, y0), (max_x, y1), (min_x, y1)]))
-
-    # Divide each row into columns and calculate the centroids
-    centroids = []
-    
-    for i, row in enumerate(rows):
-        min_x, min_y, max_x, max_y = row.bounds
-
-        if i % 2 == 0:
-            # Even row: divide into 3
-            col_width = row_width / 3
-            for j in range(3):
-                x0 = min_x + j * col_width
-                x1 = x0 + col_width
-                col = Polygon([(x0, min_y), (x1, min_y), (x1, max_y), (x0, max_y)])
-                
-                if enable_random:
-                    centroid = add_random_noise_to_polygon_centroid(polygon=col, noise_percent=noise_percent)
-                else:
-                    centroid = col.centroid
-
-                centroids.append(centroid)
-        else:
-            # Odd row: divide into 4
-            col_width = row_width / 4
-            for j in range(4):
-                x0 = min_x + j * col_width
-                x1 = x0 + col_width
-                col = Polygon([(x0, min_y), (x1, min_y), (x1, max_y), (x0, max_y)])
-                
-                if enable_random:
-                    centroid = add_random_noise_to_polygon_centroid(polygon=col, noise_percent=noise_percent)
-                else:
-                    centroid = col.centroid
-
-                centroids.append(centroid)
+    coords = _markers_grid_coords(
+        min_x, min_y, max_x, max_y, 
+        n_rows=n_rows, 
+        noise_percent=noise_percent if enable_random else None)
 
-    return centroids    
+    return [Point(x, y) for x, y in coords]
 
 
 @dataclass(kw_only=True)
@@ -4,6 +4,7 @@ import yaml
 from bgstools.datastorage import DataStore, YamlStorage
 import streamlit as st
 import hashlib
+import json
 
 
 def toggle_button(on_sidebar=False, *args, key=None, **kwargs):
@@ -176,13 +177,89 @@ def get_subdir_name(file_path):
         print(f"An error occurred: {e}")
         return None
 
+# LibYAML C emitter when available, same safe subset and output as `yaml.safe_dump`
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
 def update_station_data(STATION_DATA:dict, STATION_FILEPATH:str):
-    # Save the station data to a file.
+    # Save the station data to a file. Only this station's file is rewritten, not the whole survey.
      with open(STATION_FILEPATH, 'w', encoding='utf-8') as f:
-        yaml.safe_dump(STATION_DATA, f, allow_unicode=True)
+        yaml.dump(STATION_DATA, f, Dumper=_YAML_DUMPER, allow_unicode=True)
+
+
+def _fingerprint_payload(value):
+    """
+    Normalizes nested station data for hashing.
+
+    Dictionaries become lists of (key, value) pairs sorted by the key as a string, so keys of mixed
+    types can be ordered. `None` keys are dropped, the results tables skip them as well, e.g. the
+    blank rows added in the taxons data editor.
+    """
+    if isinstance(value, dict):
+        return sorted(
+            ((k, _fingerprint_payload(v)) for k, v in value.items() if k is not None),
+            key=lambda item: str(item[0]))
+    if isinstance(value, (list, tuple)):
+        return [_fingerprint_payload(v) for v in value]
+    return value
+
+
+def data_digest(data)->bytes:
+    """
+    Digest of nested YAML data, independent of the dictionary insertion order.
+
+    Parameters:
+    - data: The data to hash, e.g. a station or survey dictionary.
+
+    Returns:
+    - bytes: A blake2b digest of the normalized data, see `_fingerprint_payload`.
+    """
+    payload = json.dumps(_fingerprint_payload(data), default=str, separators=(',', ':'), ensure_ascii=False, check_circular=False)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+
+
+def station_fingerprint(STATION_DATA:dict, RESULTS_FRAMES:tuple, names:tuple = (), centroids_xy:dict = None)->bytes:
+    """
+    Digest of everything the station Results table reads, unchanged across reruns triggered by unrelated widgets.
+
+    Parameters:
+    - STATION_DATA (dict): The station data.
+    - RESULTS_FRAMES (tuple): Names of the random frames shown in the table.
+    - names (tuple): Survey, station and video names written on every row.
+    - centroids_xy (dict): Dotpoint id -> (x, y) centroid coordinates.
+
+    Returns:
+    - bytes: A blake2b digest of the normalized inputs, see `data_digest`.
+    """
+    RANDOM_FRAMES = STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES']
+    return data_digest([
+        names,
+        RESULTS_FRAMES,
+        [RANDOM_FRAMES[f]['INTERPRETATION']['DOTPOINTS'] for f in RESULTS_FRAMES],
+        STATION_DATA.get('SUBSTRATES', {}),
+        STATION_DATA.get('TAXONS', {}),
+        centroids_xy or {},
+        ])
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _cached_datastore(survey_filepath:str, mtime:float)->DataStore:
+    """
+    Parses the survey YAML into a DataStore once per file version.
+
+    Parameters:
+    - survey_filepath (str): Absolute path to the survey YAML file.
+    - mtime (float): Modification time of the file, a write to the file invalidates the cached DataStore.
+
+    Returns:
+    - DataStore: A shared DataStore instance, changes made through it are visible to later reruns.
+    """
+    try:
+        return DataStore(YamlStorage(file_path=survey_filepath))
+    except Exception as e:
+        raise ValueError(f"Failed to load data from {survey_filepath}: {str(e)}")
 
 
-st.cache_data()
 def load_datastore(survey_filepath:str):
     """
     Load data from a specified YAML file into a DataStore object.
@@ -213,18 +290,13 @@ def load_datastore(survey_filepath:str):
     <class 'DataStore'>
 
     Notes:
-    - This function uses Streamlit's caching mechanism (`@st.cache_data()`) to prevent unnecessary reloading of the same data, which can improve app performance, especially when dealing with large YAML files.
+    - The DataStore is cached with Streamlit's `st.cache_resource` (see `_cached_datastore`), keyed on the file path and its modification time. The YAML file is only parsed again after it changes on disk, and the returned object is shared rather than copied. Copy its data before modifying it, unsaved edits would otherwise be visible to every session.
     """    
     if not os.path.isfile(survey_filepath):
         st.warning('**No survey data available**. GO to **MENU>Survey initialization** create a new survey using the **Survey data management** menu.Refresh the browser window and try again.')
         raise FileNotFoundError(f"The file `{survey_filepath}` does not exist.")
   
-    try:
-        datastore = DataStore(YamlStorage(file_path=survey_filepath))
-    except Exception as e:
-        raise ValueError(f"Failed to load data from {survey_filepath}: {str(e)}")
-        
-    return datastore
+    return _cached_datastore(survey_filepath, os.path.getmtime(survey_filepath))
 
 
 def delete_file(file_path):
@@ -1,4 +1,6 @@
 import os
+import io
+import functools
 import streamlit as st
 import pandas as pd
 from PIL import Image
@@ -9,9 +11,10 @@ from bgsio import load_yaml
 from seafloor import substrates, phytobenthosCommonTaxa, \
 STRATUM_ID, SPECIES_FLAGS, OTHER_BENTHOS_COVER_OR_BIOTURBATION, USER_DEFINED_TAXONS
 
+from shapely import Point
 from markers import create_bounding_box, markers_grid, floating_marker 
 from custom_options import SGU_custom_options
-from seams_utils import update_station_data, toggle_button
+from seams_utils import update_station_data, toggle_button, station_fingerprint
 #from components.frames_zoom import frames_zoom
 from zoom_select_image_component import zoom_select_image_component
 
@@ -23,8 +26,24 @@ class Status(Enum):
     ERROR = 'ERROR'  # 'ICON': ':warning:'
     UPDATED = 'UPDATED'   # 'ICON': ':star:'
 
+# Substrate labels shown in the selectboxes, `substrates` is an import-time constant
+_SUBSTRATE_LABELS = tuple(s[0] for s in substrates)
+
+# SMHI species flags and stratum ids offered in the flag selectboxes, sorted once at import
+_SFLAG_OPTIONS = tuple(SPECIES_FLAGS['SFLAG'])
+_STRID_OPTIONS = tuple(sorted(STRATUM_ID['CODE']))
+
+# Taxons offered in the selectors, the inputs are import-time constants so the sorted result is computed once
+_EXTENDED_TAXONS = tuple(sorted({*phytobenthosCommonTaxa.keys(), *OTHER_BENTHOS_COVER_OR_BIOTURBATION, *USER_DEFINED_TAXONS}))
+
 # 224x224 image size coral net (https://coralnet.ucsd.edu/blog/a-new-deep-learning-engine-for-coralnet/)
 
+@functools.lru_cache(maxsize=8)
+def _with_sentinel(options:tuple)->tuple:
+    """Prepends the '---' placeholder to the selectbox options, or returns an empty tuple."""
+    return ('---', *options) if options else ()
+
+
 def show_advanced_options()->dict:
     message_advanced_options = """
     **Advanced options** are available for users with a strong understanding of the tool's functionality. 
@@ -87,109 +106,19 @@ def build_header():
     return frame_info
     
 
-st.cache_data()
+@st.cache_data(show_spinner=False)
 def convert_df(df:pd.DataFrame, index:bool=False, encoding:str='utf-8'):
-    return df.to_csv(index=index).encode(encoding)
+    # Write the encoded CSV straight into a bytes buffer, no intermediate str
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=index, encoding=encoding, chunksize=10_000)
+    return buffer.getvalue()
 
 
-def station_results(STATION_DATA, taxons:list = [], substrates:list = []):
-    df = []    
-    summary = {}
-    STATION_NAME = STATION_DATA['METADATA']['siteName']
-    SURVEY_NAME = STATION_DATA['BENTHOS_INTERPRETATION']['SURVEY_NAME']
-    VIDEO_NAME = STATION_DATA['BENTHOS_INTERPRETATION']['VIDEO_NAME']
-    STATION_DIRPATH = os.path.dirname(STATION_DATA['BENTHOS_INTERPRETATION']['STATION_FILEPATH'])
-
-    for FRAME_NAME in STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES']:
-        FRAME_INTERPRETATION = STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES'][FRAME_NAME]['INTERPRETATION']
-
-        METADATA = FRAME_INTERPRETATION.get('METADATA', {})
-        if len(METADATA) > 0:            
-            if len(FRAME_INTERPRETATION['DOTPOINTS']) > 0:
-                _FRAME_INTERPRETATION = FRAME_INTERPRETATION
-                _IDs = FRAME_INTERPRETATION['DOTPOINTS'].keys()
-                _df = pd.DataFrame.from_dict(_FRAME_INTERPRETATION['DOTPOINTS'], orient='index')
-                _df['SURVEY_NAME'] = SURVEY_NAME
-                _df['STATION_NAME'] = STATION_NAME
-                _df['VIDEO_NAME'] = VIDEO_NAME
-                _df['FRAME_NAME'] = FRAME_NAME
-                for t in taxons:
-                    _df[t] = None
-                    summary[t] = 0                                                       
-                for s in substrates:
-                    _df[s] = None
-                    summary[s] = 0
-
-                for id in _IDs:
-                    is_id = _df['DOTPOINT_ID'] == id
-                    _subtrate = _df.loc[is_id, 'SUBSTRATE']
-                    _taxons = _df.loc[is_id, 'TAXONS'].tolist()[0]
-                    if isinstance(_taxons, dict):
-                        _taxons = list(_taxons.keys())
-                    if isinstance(_subtrate, dict):
-                        _subtrate = list(_subtrate.keys())[0]
-
-                    if _subtrate in substrates:
-                        _df.loc[is_id, _subtrate] = 1
-                        
-
-                    for t in _taxons:
-                        if t is not None:                                        
-                            if t in taxons:
-                                _df.loc[is_id, t] = 1
-                                
-
-                df.append(_df)
-                
-
-
-        is_station = df['STATION_NAME'] == STATION_NAME
-
-        for t in taxons:
-            summary[t] = df.loc[is_station, t].sum()
-        for s in substrates:
-            summary[s] = df.loc[is_station, s].sum()
-
-
-        column_config = {                                        
-           
-            'frame_x_coord': {'editable': False, 'rename': False},
-            'frame_y_coord': {'editable': False, 'rename': False},
-            'DOTPOINT_ID': {'editable': False, 'rename': False},                            
-            } 
-        
-        st.markdown(f'## Percent cover `{STATION_NAME}`')
-        st.dataframe(pd.DataFrame.from_dict(summary, orient='index').T, hide_index=True)
-        st.markdown('## Survey results')
-        data_editor = st.data_editor(
-            data=df.drop(columns=['SUBSTRATE', 'TAXONS']),
-            #num_rows=10,
-            column_config= column_config,
-            key='data_editor_survey',
-            use_container_width=True, 
-            hide_index=True,
-            column_order=['SURVEY_NAME', 'STATION_NAME', 'VIDEO_NAME', 'FRAME_NAME', 'DOTPOINT_ID', 'frame_x_coord', 'frame_y_coord']+ taxons + substrates,
-            disabled=True,
-            )
-        
-
-        st.write(summary)
-        st.divider()           
-
-        save_to_file = st.button(label='Save file `csv`', key=f'button_save_survey')
-        if save_to_file:
-            filename = os.path.join(STATION_DIRPATH, f'SEAMS_{SURVEY_NAME}_RESULTS_{STATION_NAME}.csv')
-            with st.spinner('Saving file...'):
-                   df.to_csv(
-                       os.path.join(filename),
-                        encoding='utf-8',
-                        index=False,
-                        )
-                
-            if os.path.exists(filename):
-                st.info(f'File saved: {filename}')
-                st.balloons()
-
+def _first_key(value):
+    """Returns a substrate as a scalar, whether it is saved as a string or as a `{substrate: True}` dict."""
+    if isinstance(value, (dict, set, list, tuple)):
+        return next(iter(value), None)
+    return value
 
 
 def frame_results(
@@ -198,45 +127,31 @@ def frame_results(
         key:str= None):
     
     FRAME_INTERPRETATION = STATION_DATA.get('BENTHOS_INTERPRETATION', {}).get('RANDOM_FRAMES', {}).get(FRAME_NAME, {}).get('INTERPRETATION', {})
-    METADATA = FRAME_INTERPRETATION.get('METADATA', {})
-    if len(METADATA) > 0:            
-        if len(FRAME_INTERPRETATION['DOTPOINTS']) > 0:
-            _FRAME_INTERPRETATION = FRAME_INTERPRETATION
-            _IDs = FRAME_INTERPRETATION['DOTPOINTS'].keys()
-            for id in _IDs:
-                _FRAME_INTERPRETATION['DOTPOINTS'][id]['SUBSTRATE'] = [s for s in FRAME_INTERPRETATION['DOTPOINTS'][id]['SUBSTRATE']][0]
-                _FRAME_INTERPRETATION['DOTPOINTS'][id]['TAXONS'] = [t for t in FRAME_INTERPRETATION['DOTPOINTS'][id]['TAXONS']] 
-            df = pd.DataFrame.from_dict(_FRAME_INTERPRETATION['DOTPOINTS'], orient='index')
-            df['FRAME_NAME'] = FRAME_NAME
-
-            column_config = {                            
-                'TAXONS': {'editable': False, 'rename': False,},
-                'SUBSTRATE':  st.column_config.SelectboxColumn(
-                    label='SUBSTRATE',
-                    width='medium',
-                    options=[s[0] for s in substrates],                                
-                    ),  
-                'frame_x_coord': {'editable': False, 'rename': False},
-                'frame_y_coord': {'editable': False, 'rename': False},
-                'DOTPOINT_ID': {'editable': False, 'rename': False},                            
-                } 
-            
-            st.data_editor(
-                data=df,
-                num_rows=10,
-                column_config= column_config,
-                key='data_editor_frames',
-                use_container_width=True, 
-                hide_index=True,
-                column_order=['FRAME_NAME', 'DOTPOINT_ID', 'frame_x_coord', 'frame_y_coord', 'TAXONS', 'SUBSTRATE'],
-                disabled=True,
-                )
-            
-        
-        else:
-            st.warning('No dotpoints selected or saved')
-    else:
-        st.warning('No data saved for selected frame yet.')               
+    # Early exit before building anything for frames without saved results
+    if len(FRAME_INTERPRETATION.get('METADATA', {})) == 0:
+        st.warning('No data saved for selected frame yet.')
+        return
+    if len(FRAME_INTERPRETATION.get('DOTPOINTS', {})) == 0:
+        st.warning('No dotpoints selected or saved')
+        return
+
+    # One record per dotpoint, the saved DOTPOINTS are left untouched
+    df = pd.DataFrame.from_records([{
+        'FRAME_NAME': FRAME_NAME,
+        'DOTPOINT_ID': dotpoint_id,
+        'frame_x_coord': dotpoint.get('frame_x_coord', None),
+        'frame_y_coord': dotpoint.get('frame_y_coord', None),
+        'TAXONS': list(dotpoint.get('TAXONS', None) or {}),
+        'SUBSTRATE': _first_key(dotpoint.get('SUBSTRATE', None)),
+        } for dotpoint_id, dotpoint in FRAME_INTERPRETATION['DOTPOINTS'].items()])
+
+    # Read-only view, st.dataframe skips the editor state and per-column config
+    st.dataframe(
+        df,
+        use_container_width=True, 
+        hide_index=True,
+        column_order=['FRAME_NAME', 'DOTPOINT_ID', 'frame_x_coord', 'frame_y_coord', 'TAXONS', 'SUBSTRATE'],
+        )
 
 
 def benthos_main_menu(
@@ -246,7 +161,17 @@ def benthos_main_menu(
         RANDOM_FRAMES:dict, 
         ):
     
-    RANDOM_FRAMES_INDEX_DICT = {i+1:k for i, k in enumerate(RANDOM_FRAMES.keys())}
+    # The frame selection is stable for a station, rebuild the index only when it changes
+    FRAMES_KEY = tuple(RANDOM_FRAMES)
+    if st.session_state.get('_random_frames_key', None) != FRAMES_KEY:
+        RANDOM_FRAMES_INDEX_DICT = {}
+        FRAME_LABELS = {}
+        for i, k in enumerate(FRAMES_KEY, start=1):
+            RANDOM_FRAMES_INDEX_DICT[i] = k
+            FRAME_LABELS[i] = f'{i:02d} | {k}'
+        st.session_state['_random_frames_index'] = (RANDOM_FRAMES_INDEX_DICT, FRAME_LABELS)
+        st.session_state['_random_frames_key'] = FRAMES_KEY
+    RANDOM_FRAMES_INDEX_DICT, FRAME_LABELS = st.session_state['_random_frames_index']
 
     with st.sidebar.expander(label='**Benthos interpretation**', expanded=True):
         
@@ -261,8 +186,8 @@ def benthos_main_menu(
         
         FRAME_INDEX = st.selectbox(
             label='**current frame**', 
-            options=list(RANDOM_FRAMES_INDEX_DICT.keys()),
-            format_func=lambda i: f'{str(i).zfill(2)} | {RANDOM_FRAMES_INDEX_DICT[i]}',
+            options=list(RANDOM_FRAMES_INDEX_DICT),
+            format_func=FRAME_LABELS.__getitem__,
             help='Select the frame to interpret', 
             label_visibility='hidden')
         
@@ -286,6 +211,13 @@ def benthos_main_menu(
         return result
             
 
+@functools.lru_cache(maxsize=8)
+def _dotpoint_keys(n_dotpoints:int)->tuple:
+    """Toggle button keys of a grid with `n_dotpoints`, indexed by dotpoint counter - 1. Built once per grid size."""
+    return tuple(f'dotpoint_{i}' for i in range(1, n_dotpoints + 1))
+
+
+@st.cache_data
 def generate_toggle_buttons_grid(n_rows=3):
     grid =[]
     counter = 0 
@@ -310,25 +242,26 @@ def generate_toggle_buttons_grid(n_rows=3):
 def display_grid(grid, disable_dotpoints:list = [])->dict:
     """Displays the generated grid on Streamlit."""
     dotpoints_selected_dict = {}
-    counter = 0
     if grid is not None and len(grid) > 0:
+        DOTPOINT_KEYS = _dotpoint_keys(sum(len(row) for row in grid))
+        counter = 0
         for row in grid:
             cols= st.columns(len(row))        
-            for col in cols:
+            for col, label, key in zip(cols, row, DOTPOINT_KEYS[counter:counter + len(row)]):
                 with col:
-                    counter += 1
                     toggle_button(                    
-                        label = str(counter), 
-                        key=f'dotpoint_{counter}',
-                        disabled= True if str(counter) in disable_dotpoints else False,
+                        label = label, 
+                        key=key,
+                        disabled= label in disable_dotpoints,
                         on_sidebar=True, 
                         )
-                    # adds the dotpoint to the dictionary if it is selected
+            counter += len(row)
 
-                    st.session_state['COUNTER'] = counter
+        st.session_state['COUNTER'] = counter
 
-                    if st.session_state[f'dotpoint_{counter}']:
-                        dotpoints_selected_dict[counter] = True                
+        # adds the selected dotpoints to the dictionary in a single pass
+        dotpoints_selected_dict = dict.fromkeys(
+            (i for i, key in enumerate(DOTPOINT_KEYS, start=1) if st.session_state.get(key, False)), True)
             
     return dotpoints_selected_dict
 
@@ -346,31 +279,44 @@ def create_markers_grid(FRAME_NAME:str, DOTPOINTS_ADVANCED_OPTIONS:dict, bbox:tu
     # ------------------
     
     centroids_dict = { i+1: centroid for i, centroid in enumerate(centroids) }
+    st.session_state['centroids_dict'] = centroids_dict
     n_rows=DOTPOINTS_ADVANCED_OPTIONS['n_rows']
     st.session_state['n_rows'] = n_rows
     return n_rows, centroids, centroids_dict
 
+_STATUS_ICON = {
+    'IS_COMPLETE': ':white_check_mark:',
+    'IN_PROGRESS': ':hourglass_flowing_sand:',
+    'IS_ERROR': ':warning:',
+    'IS_UPDATED': ':star:',
+    'NOT_STARTED': ':no_entry:',
+    }
+
 def get_tab_suffix_icon(status):
-    if status == 'IS_COMPLETE':
-        tab_suffix = ':white_check_mark:'
-    elif status == 'IN_PROGRESS':
-        tab_suffix = ':hourglass_flowing_sand:'
-    elif status == 'IS_ERROR':
-        tab_suffix = ':warning:'
-    elif status == 'IS_UPDATED':
-        tab_suffix = ':star:'
-    elif status == "NOT_STARTED":
-        tab_suffix = ':no_entry:'
-    else: 
-        tab_suffix = ''
-    return tab_suffix
-
-st.cache_data()
-def extended_taxons_list()->list:
-    
-    extended_list = sorted(list(phytobenthosCommonTaxa.keys()) + list(OTHER_BENTHOS_COVER_OR_BIOTURBATION) + list(USER_DEFINED_TAXONS))    
-    
-    return extended_list
+    return _STATUS_ICON.get(status, '')
+
+def _taxa_column_config(colnames:tuple)->dict:
+    """Checkbox column config per dotpoint, rebuilt only when the dotpoint columns change."""
+    if st.session_state.get('_taxa_column_config_sig', None) != colnames:
+        st.session_state['_taxa_column_config'] = {
+            f'{i}': st.column_config.CheckboxColumn(
+                i,
+                width='auto',
+                required=True,
+                default=False,
+                )
+                for i in colnames}
+        st.session_state['_taxa_column_config_sig'] = colnames
+    return st.session_state['_taxa_column_config']
+
+def extended_taxons_list()->tuple:
+    return _EXTENDED_TAXONS
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _load_frame_image(frame_filepath:str, mtime:float)->Image.Image:
+    """Decodes a frame once per file version (`mtime`). The image is shared across reruns, do not modify it in place."""
+    return Image.open(frame_filepath).convert('RGB')
+
 
 def show_frame_select_menu(
         SURVEY_NAME:str, 
@@ -403,7 +349,7 @@ def show_frame_select_menu(
         st.session_state[FRAME_NAME] = 0
     
     # --------------------
-    image = Image.open(FRAME_FILEPATH)
+    image = _load_frame_image(FRAME_FILEPATH, os.path.getmtime(FRAME_FILEPATH))
     return frame_selected_dict, image
 
 
@@ -417,24 +363,24 @@ def taxons_interpretation(SPECIES_FLAGS:dict, STRATUM_ID:dict)->dict:
         key='taxons_multiselect',
         )
 
-    taxa_to_flag = [t for t in _taxons]
+    # Ordered set of the final taxa names, flagging swaps in the flagged name
+    taxa_to_flag = dict.fromkeys(_taxons, True)
     
     # ----------------           
     with st.expander(label='**Taxa flags**', expanded=False):
         if len(taxa_to_flag) > 0:
             flag_taxa = st.selectbox(
                 label = 'Taxa to flag', 
-                options=['---'] + taxa_to_flag if taxa_to_flag is not None  and len(taxa_to_flag)>0 else [],
+                options=_with_sentinel(tuple(taxa_to_flag)),
                 index=0,
                 help='Select **taxa** to apply flags',
                 placeholder='Select a taxa to apply flags',)
             
             if flag_taxa != '---':
                     
-                SFLAG_options = [s for s in SPECIES_FLAGS['SFLAG']]
                 SFLAG = st.selectbox(
                     label = 'SFLAG(s)', 
-                    options=['---'] + SFLAG_options if SFLAG_options is not None  and len(SFLAG_options)>0 else [],
+                    options=_with_sentinel(_SFLAG_OPTIONS),
                     help='Select the **taxon flags** present in the selected taxa',)
                 
                 SFLAG_string = f'SFLAG {SFLAG}' if SFLAG != '---' else ''
@@ -442,10 +388,9 @@ def taxons_interpretation(SPECIES_FLAGS:dict, STRATUM_ID:dict)->dict:
                 if SFLAG != '---':
                     st.info(SPECIES_FLAGS['SFLAG'][SFLAG])
                 
-                STRID_options = sorted([s for s in STRATUM_ID['CODE']])
                 STRID = st.selectbox(
                     label = 'STRID - Stratum ID', 
-                    options=['---'] + STRID_options if STRID_options is not None  and len(STRID_options)>0 else [],
+                    options=_with_sentinel(_STRID_OPTIONS),
                     help='Select the **taxon rid** present in the selected taxa',)
 
                 if STRID != '---':
@@ -462,24 +407,21 @@ def taxons_interpretation(SPECIES_FLAGS:dict, STRATUM_ID:dict)->dict:
                         label=f'**keep only :blue[{flagged_taxa}]** and remove **:red[{flag_taxa}]**', 
                         value=True, 
                         help=f'If enabled, ***{flag_taxa}*** will removed from the taxons and only **{flagged_taxa}** will be kept.')
-                    if not keep_only_flagged_taxa:
-                        taxa_to_flag.append(flagged_taxa)
-                        st.session_state['CURRENT']['taxa_to_flag'] = taxa_to_flag
-                        
-                    else:
-                        taxa_to_flag.remove(flag_taxa)
-                        taxa_to_flag.append(flagged_taxa)
-                        st.session_state['CURRENT']['taxa_to_flag'] = taxa_to_flag
+                    if keep_only_flagged_taxa:
+                        taxa_to_flag.pop(flag_taxa, None)
+                    taxa_to_flag[flagged_taxa] = True
+                    # Stored as a list, the schema of the current cache file
+                    st.session_state['CURRENT']['taxa_to_flag'] = list(taxa_to_flag)
     # ------------------
     # Overall taxons
-    result_taxons = {i:True for i in taxa_to_flag}  
+    result_taxons = dict(taxa_to_flag)
 
     return result_taxons
 
-def substrates_interpretation(substrates:dict)->dict:
+def substrates_interpretation(substrate_labels:tuple = _SUBSTRATE_LABELS)->dict:
     substrate = st.selectbox(
                     label='**Substrates**',
-                    options=[s[0] for s in substrates],
+                    options=substrate_labels,
                     help='Select the **substrate** present for the selected `dotpoints` in the frame.',
                     placeholder='Select substrate',
                     key='substrates_selectbox',
@@ -566,7 +508,7 @@ def search_value_in_dataframe(df:pd.DataFrame, target:str)->dict:
     return result
 
 
-def taxons_selector(taxa_to_flag: list, SPECIES_FLAGS:dict=SPECIES_FLAGS, STRATUM_ID:dict=STRATUM_ID)->str:
+def taxons_selector(taxa_to_flag: dict, SPECIES_FLAGS:dict=SPECIES_FLAGS, STRATUM_ID:dict=STRATUM_ID)->str:
 
     # ----------------           
 
@@ -577,7 +519,7 @@ def taxons_selector(taxa_to_flag: list, SPECIES_FLAGS:dict=SPECIES_FLAGS, STRATU
                 
             flag_taxa = st.selectbox(
                 label = 'Taxa to flag', 
-                options=['---'] + taxa_to_flag if taxa_to_flag is not None  and len(taxa_to_flag)>0 else [],
+                options=_with_sentinel(tuple(taxa_to_flag)),
                 index=0,
                 help='Select **taxa** to apply flags',
                 placeholder='Select a taxa to apply flags',)
@@ -587,10 +529,9 @@ def taxons_selector(taxa_to_flag: list, SPECIES_FLAGS:dict=SPECIES_FLAGS, STRATU
             if flag_taxa != '---':
                 flagged_taxa = flag_taxa
                     
-                SFLAG_options = [s for s in SPECIES_FLAGS['SFLAG']]
                 SFLAG = st.selectbox(
                     label = 'SFLAG(s)', 
-                    options=['---'] + SFLAG_options if SFLAG_options is not None  and len(SFLAG_options)>0 else [],
+                    options=_with_sentinel(_SFLAG_OPTIONS),
                     help='Select the **taxon flags** present in the selected taxa',)
                 
                 SFLAG_string = f'SFLAG {SFLAG}' if SFLAG != '---' else ''
@@ -600,10 +541,9 @@ def taxons_selector(taxa_to_flag: list, SPECIES_FLAGS:dict=SPECIES_FLAGS, STRATU
                 with tscol3:
                     
                     
-                    STRID_options = sorted([s for s in STRATUM_ID['CODE']])
                     STRID = st.selectbox(
                         label = 'STRID - Stratum ID', 
-                        options=['---'] + STRID_options if STRID_options is not None  and len(STRID_options)>0 else [],
+                        options=_with_sentinel(_STRID_OPTIONS),
                         help='Select the **taxon rid** present in the selected taxa',)
 
                     if STRID != '---':
@@ -621,8 +561,8 @@ def taxons_selector(taxa_to_flag: list, SPECIES_FLAGS:dict=SPECIES_FLAGS, STRATU
                         
                         confirm_taxa_to_flag = st.button(label=f'ADD: **{flagged_taxa}**', help=f'Confirm the **taxa** to add to the available taxa list')
                         if confirm_taxa_to_flag:
-                            taxa_to_flag.remove(flag_taxa)
-                            taxa_to_flag.append(flagged_taxa)
+                            taxa_to_flag.pop(flag_taxa, None)
+                            taxa_to_flag[flagged_taxa] = True
                 
                             if flag_taxa != flagged_taxa:                                
                                 return flagged_taxa
@@ -683,11 +623,25 @@ def translate_dictionary(input_dict):
 
     return translated_dict
     
-#st.cache_data()    
-def show_modified_image(image, centroids_dict:dict, show_dotpoints_overlay:bool=True):
+@st.cache_data(max_entries=32, show_spinner=False)
+def _render_markers(frame_filepath:str, mtime:float, centroids_key:tuple):
+    """Draws the dotpoints overlay once per (frame version, centroids) pair.
+
+    `centroids_key` is a hashable tuple of `(id, x, y)` entries, see `show_modified_image`.
+    """
+    centroids_dict = {i: Point(x, y) for i, x, y in centroids_key}
+    # Reuses the decoded frame, `floating_marker` draws on a copy
+    return floating_marker(_load_frame_image(frame_filepath, mtime), centroids_dict=centroids_dict)
+
+
+def show_modified_image(image, centroids_dict:dict, show_dotpoints_overlay:bool=True, frame_filepath:str=None):
     
     if show_dotpoints_overlay:
-        modified_image = floating_marker(image, centroids_dict=centroids_dict)
+        if frame_filepath is not None:
+            centroids_key = tuple((i, c.x, c.y) for i, c in sorted(centroids_dict.items()))
+            modified_image = _render_markers(frame_filepath, os.path.getmtime(frame_filepath), centroids_key)
+        else:
+            modified_image = floating_marker(image, centroids_dict=centroids_dict)
     else:
         modified_image = image
 
@@ -791,12 +745,12 @@ def get_station_interpreted_taxons_subtrates(STATION_DATA:dict)->dict:
     
     for FRAME_NAME in RANDOM_FRAMES:
         taxons = {}
-        substrates = {}
-        for _, dotpoint in RANDOM_FRAMES[FRAME_NAME]['INTERPRETATION']['DOTPOINTS'].items():
-            if dotpoint['TAXONS'] is not None and len(dotpoint['TAXONS']) > 0:
-                taxons = {**taxons, **dotpoint['TAXONS']}
-            if dotpoint['SUBSTRATE'] is not None and len(dotpoint['SUBSTRATE']) > 0:
-                substrates[dotpoint['SUBSTRATE']] = True
+        DOTPOINTS = RANDOM_FRAMES[FRAME_NAME]['INTERPRETATION']['DOTPOINTS'].values()
+        for dotpoint in DOTPOINTS:
+            if dotpoint['TAXONS']:
+                # merge in place instead of rebuilding the dictionary for every dotpoint
+                taxons.update(dotpoint['TAXONS'])
+        substrates = dict.fromkeys((dotpoint['SUBSTRATE'] for dotpoint in DOTPOINTS if dotpoint['SUBSTRATE']), True)
         station[FRAME_NAME] = {'TAXONS': taxons, 'SUBSTRATES': substrates}
     return station
 
@@ -804,18 +758,21 @@ def get_station_interpreted_taxons_subtrates(STATION_DATA:dict)->dict:
 def show_station_progress(STATION_DATA:dict):
 
     STATION_NAME = STATION_DATA['BENTHOS_INTERPRETATION']['STATION_NAME']
-    frames_taxons_interpreted = {}
-    frames_substrates_interpreted = {}
-    station_seafloor = get_station_interpreted_taxons_subtrates(STATION_DATA)
+    RANDOM_FRAMES = STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES']
 
-    for FRAME_NAME in station_seafloor.keys():
-        frames_taxons_interpreted[FRAME_NAME] = True if len(station_seafloor[FRAME_NAME]['TAXONS'])>0 else False
-        frames_substrates_interpreted[FRAME_NAME] = True if len(station_seafloor[FRAME_NAME]['SUBSTRATES'])>0 else False
-    
-    progress_dict = {'TAXONS': frames_taxons_interpreted, 'SUBSTRATES': frames_substrates_interpreted}
+    # One flag row per dotpoint, reduced per frame with a single grouped `any` instead of merging dicts frame by frame
+    frames, has_taxons, has_substrate = [], [], []
+    for FRAME_NAME, FRAME in RANDOM_FRAMES.items():
+        for dotpoint in FRAME['INTERPRETATION']['DOTPOINTS'].values():
+            frames.append(FRAME_NAME)
+            has_taxons.append(bool(dotpoint['TAXONS']))
+            has_substrate.append(bool(dotpoint['SUBSTRATE']))
+
+    progress_df = pd.DataFrame({'FRAME_NAME': frames, 'TAXONS': has_taxons, 'SUBSTRATES': has_substrate}).groupby(
+        'FRAME_NAME', sort=False).any().reindex(list(RANDOM_FRAMES), fill_value=False)
     
     st.subheader(f'**:blue[{STATION_NAME}] | interpretation progress**')
-    st.dataframe(pd.DataFrame(progress_dict).T)
+    st.dataframe(progress_df.T)
 
 
 def create_station_summary(STATION_DATA:dict):
@@ -878,7 +835,7 @@ try:
     CURRENT_FILENAME = 'seams_current_cache_data.yaml'
     CURRENT_FILEPATH = os.path.join(DATA_DIRPATH, CURRENT_FILENAME)        
 
-    if CURRENT_FILENAME not in os.listdir(DATA_DIRPATH):
+    if not os.path.isfile(CURRENT_FILEPATH):
         st.warning('**Fresh current state**. Please Initializing survey data from `MENU`>`Stations initialization`**') 
         st.stop()
     else:
@@ -893,11 +850,8 @@ try:
         suffix = st.session_state.get('suffix', '***')
 
         # --------------------
-        SURVEY_FILEPATH = CURRENT.get('SURVEY_FILEPATH', None) 
-        SURVEY_NAME = CURRENT.get('SURVEY_NAME', None)
-        SURVEY_FILEPATH = CURRENT.get('SURVEY_FILEPATH', None)
-        STATION_NAME = CURRENT.get('STATION_NAME', None)
-        STATION_FILEPATH = CURRENT.get('STATION_FILEPATH', None)
+        SURVEY_NAME, SURVEY_FILEPATH, STATION_NAME, STATION_FILEPATH = map(
+            CURRENT.get, ('SURVEY_NAME', 'SURVEY_FILEPATH', 'STATION_NAME', 'STATION_FILEPATH'))
 
         if STATION_FILEPATH is not None and os.path.exists(STATION_FILEPATH):
             with st.spinner('Loading station data...'):
@@ -970,17 +924,21 @@ try:
                 
             else:
                 centroids = st.session_state['centroids']
-                centroids_dict = { i+1: centroid for i, centroid in enumerate(centroids) }
+                # Reuse the dictionary built by `create_markers_grid`
+                centroids_dict = st.session_state.get('centroids_dict', None)
+                if centroids_dict is None:
+                    centroids_dict = { i+1: centroid for i, centroid in enumerate(centroids) }
+                    st.session_state['centroids_dict'] = centroids_dict
                 n_rows=st.session_state['n_rows']
 
-            centroids_dict = { i+1: centroid for i, centroid in enumerate(centroids) }
             # ENHANCEMENT: RE-ENABLE n-ROWS and auto select 10 random frames
             colnames = [str(i).zfill(3) for i in centroids_dict.keys()]
 
             modified_image = show_modified_image(
                 image, 
                 centroids_dict=centroids_dict, 
-                show_dotpoints_overlay=show_dotpoints_overlay)
+                show_dotpoints_overlay=show_dotpoints_overlay,
+                frame_filepath=frame_selected_dict.get('FRAME_FILEPATH', None))
             
             # st.image(modified_image, use_column_width=True)                                 
             zoom_select_image_component(modified_image,  image_key=f"{FRAME_NAME}_{show_dotpoints_overlay}", rectangle_width=250, rectangle_height=250)
@@ -993,7 +951,7 @@ try:
                 with st.expander(label='**Substrates Interpretation**', expanded=True):
                         
                     data_config_dict_substrates = {
-                        'options': [s[0] for s in substrates],
+                        'options': _SUBSTRATE_LABELS,
                         'dotpoint_type': 'Substrates',
                         }
                     # ------------------
@@ -1017,7 +975,11 @@ try:
                     # = substrates_results
                     #with st.spinner('Updating Frame Substrates...'):
                     #    update_station_data(st.session_state['CURRENT'], st.session_state['CURRENT_FILEPATH'])
-                    if confirm_substrates:
+                    # Confirming an unchanged frame skips the write and the rerun
+                    substrates_changed = confirm_substrates and any(
+                        substrate is not None and FRAME_SUBSTRATES.get(row, {}).get(dotpoint, None) != substrate
+                        for row, dotpoints in substrates_results.items() for dotpoint, substrate in dotpoints.items())
+                    if substrates_changed:
 
                         with st.spinner('Updating substrates station data...'):
                             STATION_DATA = frame_to_station_substrates_dictionary(
@@ -1056,10 +1018,9 @@ try:
                         if show_SMHI_SFLAGS_STRID and _taxa_to_add is not None and len(_taxa_to_add) > 0:
                             
                             with tcol3:                        
-                                SFLAG_options = [s for s in SPECIES_FLAGS['SFLAG']]
                                 SFLAG = st.selectbox(
                                     label = 'SFLAG(s)', 
-                                    options=['---'] + SFLAG_options if SFLAG_options is not None  and len(SFLAG_options)>0 else [],
+                                    options=_with_sentinel(_SFLAG_OPTIONS),
                                     help='Select the **taxon flags** present in the selected taxa',)
                                 
                                 SFLAG_string = f'SFLAG {SFLAG}' if SFLAG != '---' else ''
@@ -1067,10 +1028,9 @@ try:
                                     st.info(SPECIES_FLAGS['SFLAG'][SFLAG])
                         
                             with tcol4:
-                                STRID_options = sorted([s for s in STRATUM_ID['CODE']])
                                 STRID = st.selectbox(
                                     label = 'STRID - Stratum ID', 
-                                    options=['---'] + STRID_options if STRID_options is not None  and len(STRID_options)>0 else [],
+                                    options=_with_sentinel(_STRID_OPTIONS),
                                     help='Select the **taxon rid** present in the selected taxa',)
 
                                 if STRID != '---':
@@ -1084,7 +1044,7 @@ try:
                     # --------------
                         
                     if _taxa_to_add is not None and len(_taxa_to_add) > 0:
-                        FRAME_TAXA = {_taxa_to_add: {i : False for i in colnames}}
+                        FRAME_TAXA = {_taxa_to_add: dict.fromkeys(colnames, False)}
                     else:
                         FRAME_TAXA = {}
 
@@ -1097,14 +1057,7 @@ try:
                         hide_index=False,
                         num_rows='fixed',
                         use_container_width=True,
-                        column_config={
-                            f'{i}': st.column_config.CheckboxColumn(
-                                i,
-                                width='auto',
-                                required=True,
-                                default=False,
-                                )
-                                for i in colnames},
+                        column_config=_taxa_column_config(tuple(colnames)),
                         key=f'data_editor_taxa',                        
                         )                
                     
@@ -1126,65 +1079,69 @@ try:
                         hide_index=False,
                         num_rows='dynamic',
                         use_container_width=True,
-                        column_config={
-                            f'{i}': st.column_config.CheckboxColumn(
-                                i,
-                                width='auto',
-                                required=True,
-                                default=False,
-                                )
-                                for i in colnames},
+                        column_config=_taxa_column_config(tuple(colnames)),
                         key=f'data_editor_taxons',                        
                         )
                                         
                     taxons_results = translate_dictionary(frame_taxons_df.to_dict())
+                    # Only the editor values that differ from the saved frame taxons are merged and persisted
+                    SAVED_TAXONS = station_to_frame_taxons_dictionary(frame_name=FRAME_NAME, STATION_DATA=STATION_DATA)
+                    taxons_delta = {}
+                    for taxon, dotpoints in taxons_results.items():
+                        saved_dotpoints = SAVED_TAXONS.get(taxon, {})
+                        changed = {dotpoint: value for dotpoint, value in dotpoints.items() if saved_dotpoints.get(dotpoint, None) != value}
+                        if changed:
+                            taxons_delta[taxon] = changed
                     FRAME_TAXONS.update(taxons_results)
                     #with st.spinner('Updating Frame Taxons...'):
                     #    update_station_data(st.session_state['CURRENT'], st.session_state['CURRENT_FILEPATH'])
                     
-                    with st.spinner('Updating station data...'):
-                        STATION_DATA = frame_to_station_taxons_dictionary(
-                        frame_name=FRAME_NAME, STATION_DATA=STATION_DATA, taxons_results=taxons_results)
-                    
-                    update_station_data(STATION_DATA=STATION_DATA, STATION_FILEPATH=STATION_FILEPATH)
+                    if taxons_delta:
+                        with st.spinner('Updating station data...'):
+                            STATION_DATA = frame_to_station_taxons_dictionary(
+                            frame_name=FRAME_NAME, STATION_DATA=STATION_DATA, taxons_results=taxons_delta)
+                        
+                        update_station_data(STATION_DATA=STATION_DATA, STATION_FILEPATH=STATION_FILEPATH)
 
             
             with tabFrameGeneral:
-                tfcol1, tfcol2 = st.columns([1,1])
-                with tfcol1:
-                    st.markdown('**General in frame**')
+                # One rerun per confirm instead of one per widget change in the tab
+                with st.form(key='frame_general_form'):
+                    tfcol1, tfcol2 = st.columns([1,1])
+                    with tfcol1:
+                        st.markdown('**General in frame**')
                 
-                    FRAME_INTERPRETATION = STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES'][FRAME_NAME]['INTERPRETATION']
+                        FRAME_INTERPRETATION = STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES'][FRAME_NAME]['INTERPRETATION']
 
-                    OTHER_COVERS = [i for i in FRAME_INTERPRETATION.get('GENERAL_IN_FRAME', {}).keys()]
+                        OTHER_COVERS = list(FRAME_INTERPRETATION.get('GENERAL_IN_FRAME', {}))
                     
-                    GENERAL_IN_FRAME = st.multiselect(
-                        label='**Other cover or bioturbation**',
-                        options= OTHER_COVERS + extended_taxons_list(),
-                        help='Select the **other benthos cover or bioturbation** present in the frame.',
-                        placeholder='Select other benthos cover or bioturbation',
-                        default=OTHER_COVERS if len(OTHER_COVERS) > 0 else None,
-                        key=f'general_multiselect_{FRAME_NAME}',
-                    )
-                    _GENERAL_IN_FRAME = {k:True for k in GENERAL_IN_FRAME}
-                    FRAME_INTERPRETATION['GENERAL_IN_FRAME'] = _GENERAL_IN_FRAME
+                        GENERAL_IN_FRAME = st.multiselect(
+                            label='**Other cover or bioturbation**',
+                            options= [*OTHER_COVERS, *extended_taxons_list()],
+                            help='Select the **other benthos cover or bioturbation** present in the frame.',
+                            placeholder='Select other benthos cover or bioturbation',
+                            default=OTHER_COVERS if len(OTHER_COVERS) > 0 else None,
+                            key=f'general_multiselect_{FRAME_NAME}',
+                        )
+                        _GENERAL_IN_FRAME = dict.fromkeys(GENERAL_IN_FRAME, True)
                     
 
-                with tfcol2:
-                    st.markdown('**Custom options**')
-                    custom_options =  SGU_custom_options(FRAME_INTERPRETATION=FRAME_INTERPRETATION)
+                    with tfcol2:
+                        st.markdown('**Custom options**')
+                        custom_options =  SGU_custom_options(FRAME_INTERPRETATION=FRAME_INTERPRETATION)
+
+                    confirm_frame_general = st.form_submit_button(label='Confirm frame general')
+
+                # Widget values are kept local and only written back, and saved, when confirmed and they differ from the frame
+                if confirm_frame_general and (FRAME_INTERPRETATION.get('GENERAL_IN_FRAME', None) != _GENERAL_IN_FRAME or FRAME_INTERPRETATION.get('CUSTOM_OPTIONS', None) != custom_options):
+                    FRAME_INTERPRETATION['GENERAL_IN_FRAME'] = _GENERAL_IN_FRAME
                     FRAME_INTERPRETATION['CUSTOM_OPTIONS'] = custom_options
-                    
-                
-                update_station_data(STATION_DATA=STATION_DATA, STATION_FILEPATH=STATION_FILEPATH)
+                    update_station_data(STATION_DATA=STATION_DATA, STATION_FILEPATH=STATION_FILEPATH)
                     
                 # -------------------
 
             
             with tabResults:
-                results = []
-                STATION_DATA = load_yaml(STATION_FILEPATH)
-
                 show_station_progress(STATION_DATA=STATION_DATA)
                 
                 #for p in STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES'][FRAME_NAME]['INTERPRETATION']['DOTPOINTS']:
@@ -1192,58 +1149,74 @@ try:
                 #    STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES'][FRAME_NAME]['INTERPRETATION']['DOTPOINTS'][p]['frame_y_coord'] = centroids_dict[int(p)].y
                 
                 st.markdown(f'**Station summary**')
-                            
-                if 'TAXONS' not in STATION_DATA:
-                    STATION_DATA['TAXONS'] = {}
-                if 'SUBSTRATES' not in STATION_DATA:
-                    STATION_DATA['SUBSTRATES'] = {}
                 
-                core_columns = {'SURVEY_NAME':str, 'STATION_NAME':str, 'VIDEO_NAME':str, 'FRAME_NAME':str, 'DOTPOINT_ID':str, 'frame_x_coord':int, 'frame_y_coord':int} 
+                # The whole station is shown by default, switching off narrows the table to the active frame
+                show_all_frames = st.toggle(
+                    label='**all frames**', 
+                    value=True, 
+                    key='results_all_frames', 
+                    help='Show the results of every frame in the station instead of the current frame only.')
                 
-                for _FRAME_NAME in STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES']:
-                    result_dict = STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES'][_FRAME_NAME]['INTERPRETATION']['DOTPOINTS']
-                    for p in result_dict:
-                        result_dict[p]['DOTPOINT_ID'] = p
-                        result_dict[p]['FRAME_NAME'] = _FRAME_NAME
-                        result_dict[p]['SURVEY_NAME'] = SURVEY_NAME
-                        result_dict[p]['STATION_NAME'] = STATION_NAME
-                        result_dict[p]['VIDEO_NAME'] = VIDEO_NAME
-                        result_dict[p]['frame_x_coord'] = centroids_dict[int(p)].x
-                        result_dict[p]['frame_y_coord'] = centroids_dict[int(p)].y
-                        s = result_dict[p]['SUBSTRATE']
-                        if s is not None:                        
-                            result_dict[p][result_dict[p]['SUBSTRATE']] = True
-                            STATION_DATA['SUBSTRATES'][s] = True
-                        for t in result_dict[p]['TAXONS']:
-                            if t is not None:
-                                result_dict[p][t] = result_dict[p]['TAXONS'][t]
-                                STATION_DATA['TAXONS'][t] = True
-                    
-                    substrates_columns = {s:bool for s in STATION_DATA['SUBSTRATES'].keys()}
-                    taxons_columns = {t:bool for t in STATION_DATA['TAXONS'].keys()}
-                    
-                    frames_df = pd.DataFrame.from_dict(
-                            result_dict, 
-                            orient='index', 
-                            columns=list(core_columns.keys()) + list(substrates_columns.keys()) + list(taxons_columns.keys()), 
-                            
-                            )
-                    
-                    results.append(frames_df)
-                    # ---------
-                station_df = pd.concat(results)
-                st.dataframe(
-                    station_df[list(core_columns.keys()) + list(substrates_columns.keys()) + list(taxons_columns.keys())], 
-                    hide_index=True)
+                RESULTS_FRAMES = STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES'] if show_all_frames else [FRAME_NAME]
+
+                # Centroid pixel coordinates extracted once, dotpoint id -> (x, y)
+                CENTROIDS_XY = {k: (c.x, c.y) for k, c in centroids_dict.items()}
+
+                # The table is rebuilt only when its inputs change, reruns from unrelated widgets reuse the last one
+                results_fingerprint = station_fingerprint(
+                    STATION_DATA, 
+                    tuple(RESULTS_FRAMES), 
+                    names=(SURVEY_NAME, STATION_NAME, VIDEO_NAME), 
+                    centroids_xy=CENTROIDS_XY)
+                cached_results = st.session_state.get('_station_results_cache', None)
+                if cached_results is None or cached_results[0] != results_fingerprint:
+                    # Station-wide columns, seeded from the saved ones. The saved STATION_DATA is only read here
+                    STATION_SUBSTRATES = dict(STATION_DATA.get('SUBSTRATES', {}))
+                    STATION_TAXONS = dict(STATION_DATA.get('TAXONS', {}))
+                
+                    core_columns = {'SURVEY_NAME':str, 'STATION_NAME':str, 'VIDEO_NAME':str, 'FRAME_NAME':str, 'DOTPOINT_ID':str, 'frame_x_coord':int, 'frame_y_coord':int} 
+                
+                    # One row per dotpoint, read straight from the saved dotpoints in a single pass
+                    records = []
+                    for _FRAME_NAME in RESULTS_FRAMES:
+                        result_dict = STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES'][_FRAME_NAME]['INTERPRETATION']['DOTPOINTS']
+                        for p, dotpoint in result_dict.items():
+                            frame_x_coord, frame_y_coord = CENTROIDS_XY[int(p)]
+                            record = {
+                                'SURVEY_NAME': SURVEY_NAME,
+                                'STATION_NAME': STATION_NAME,
+                                'VIDEO_NAME': VIDEO_NAME,
+                                'FRAME_NAME': _FRAME_NAME,
+                                'DOTPOINT_ID': p,
+                                'frame_x_coord': frame_x_coord,
+                                'frame_y_coord': frame_y_coord,
+                                'SUBSTRATE': dotpoint['SUBSTRATE'],
+                                }
+                            if dotpoint['SUBSTRATE'] is not None:
+                                STATION_SUBSTRATES[dotpoint['SUBSTRATE']] = True
+                            for t, value in dotpoint['TAXONS'].items():
+                                if t is not None:
+                                    record[t] = value
+                                    STATION_TAXONS[t] = True
+                            records.append(record)
+                        # ---------
+                    station_df = pd.DataFrame.from_records(
+                        records, 
+                        columns=[*core_columns, 'SUBSTRATE', *STATION_TAXONS])
+                    # Substrate one-hot columns in one vectorized pass, saved substrates not seen here stay False
+                    substrates_df = pd.get_dummies(station_df.pop('SUBSTRATE'), dtype=bool).reindex(columns=list(STATION_SUBSTRATES), fill_value=False)
+                    station_df = pd.concat([station_df[list(core_columns)], substrates_df, station_df[list(STATION_TAXONS)]], axis=1)
+                    # Converted once per build, st.dataframe then hands Arrow-backed columns to the frontend as they are
+                    station_df = station_df.convert_dtypes(dtype_backend='pyarrow')
+                    st.session_state['_station_results_cache'] = (results_fingerprint, station_df)
+                station_df = st.session_state['_station_results_cache'][1]
+                st.dataframe(station_df, hide_index=True)
 
         else:
             st.warning('Survey not initialized. Go to **Menu>Survey initialization** to initialize the survey.')
             
 
 except Exception as e:
-    trace_error = traceback.print_exc()
-    if trace_error is None:
-        trace_error= ''
-    else:        
-        st.error(f'**Benthos interpretation exception:** {trace_error} {e} | **Refresh the app and try again**')
+    trace_error = traceback.format_exc()
+    st.error(f'**Benthos interpretation exception:** {trace_error} {e} | **Refresh the app and try again**')
     
\ No newline at end of file
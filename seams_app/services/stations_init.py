@@ -1,22 +1,29 @@
 import os
 import re
+import copy
+import functools
 import streamlit as st
 import pandas as pd
 from PIL import Image
 from bgstools.io import get_files_dictionary, is_directory_empty, delete_directory_contents, extract_frames, select_random_frames
 from bgstools.utils import colnames_dtype_mapping, get_nested_dict_value
 from bgstools.datastorage import DataStore
-from bgstools.io.media import get_video_info, convert_codec
 from bgsio import load_yaml, create_new_directory
 import traceback
-import yaml
-from seams_utils import get_surveys_available, get_stations_available, update_station_data, load_datastore
+from seams_utils import get_surveys_available, get_stations_available, update_station_data, load_datastore, data_digest
+
+
+# A sequence of exactly 6 digits preceded by 'frame__', compiled once
+_SEQ_RE = re.compile(r'frame__(\d{6})_sec\.png$')
+
+
+# Maximum number of frames offered at once by the random frames selector
+_FRAMES_WINDOW_SIZE = 200
 
 
 def extract_sequence(filename: str) -> str:
     """Extracts the sequence number from the filename and returns in the format SEC_xxxxxx."""
-    # Use regex to find a sequence of exactly 6 digits preceded by 'frame__'
-    match = re.search(r'frame__([\d]{6})_sec\.png$', filename)
+    match = _SEQ_RE.search(filename)
     if match:
         return f"SEC_{match.group(1)}"
     else:
@@ -48,11 +55,12 @@ def show_survey_summary(STATIONS:dict, SURVEY_NAME):
     
     if STATIONS is not None and SURVEY_NAME is not None:        
         with st.sidebar.expander(label='**Survey summary**', expanded=True):
+            N_STATIONS = len(STATIONS)
             with st.container():
-                if len(STATIONS)>0:
+                if N_STATIONS>0:
                     st.metric(
                         label=f"**{SURVEY_NAME} | number of stations:**", 
-                        value=len(STATIONS),
+                        value=N_STATIONS,
                         delta=None,
                         help="Number of stations in the survey. **Note:** this number is updated when station's surveys are added or removed after `save survey data`."
                         )
@@ -62,6 +70,62 @@ def show_survey_summary(STATIONS:dict, SURVEY_NAME):
         st.sidebar.warning('**No stations available**')
 
 
+def _config()->tuple:
+    """Configuration directory path and dtype filenames from the session state, read with a single lookup."""
+    APP_CONFIG = st.session_state['APP']['CONFIG']
+    return APP_CONFIG['CONFIG_DIRPATH'], APP_CONFIG.get('DTYPES', {})
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_load_yaml(path:str, mtime:float, size:int)->dict:
+    """Parses a yaml file once per file version (`mtime`, `size`). The result is shared, do not modify it in place."""
+    return load_yaml(path)
+
+
+def _load_dtype_mapping(config_dirpath:str, filename:str)->dict:
+    """
+    Loads a columns/dtypes yaml configuration file and returns its column name to data type mapping.
+
+    Parameters:
+    - config_dirpath (str): Path to the application configuration directory.
+    - filename (str): Name of the yaml configuration file inside `config_dirpath`.
+
+    Returns:
+    - dict: A dictionary mapping column names to their data types.
+
+    Note:
+    - The yaml file is parsed once per version (see `_cached_load_yaml`), an edit to the file is picked up on the next call.
+    """
+    path = os.path.join(config_dirpath, filename)
+    stat = os.stat(path)
+    return colnames_dtype_mapping(_cached_load_yaml(path, stat.st_mtime, stat.st_size))
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_files_dict(dirpath:str, file_extension:str, dir_mtime:float)->dict:
+    """`get_files_dictionary` listing of `dirpath`, cached per directory version (`dir_mtime`)."""
+    return get_files_dictionary(dirpath, file_extension=file_extension, keep_extension_in_key=True)
+
+
+def _get_files_dictionary(dirpath:str, file_extension:str)->dict:
+    """
+    Lists the files with the given extension in a directory, keyed by filename with its extension.
+
+    Parameters:
+    - dirpath (str): Path to the directory to list.
+    - file_extension (str): Extension of the files to include.
+
+    Returns:
+    - dict: A dictionary mapping filenames to their paths.
+
+    Note:
+    - Adding or removing files updates the directory modification time, which invalidates the cached listing.
+    """
+    if dirpath is None or not os.path.isdir(dirpath):
+        return get_files_dictionary(dirpath, file_extension=file_extension, keep_extension_in_key=True)
+    return _cached_files_dict(dirpath, file_extension, os.path.getmtime(dirpath))
+
+
 def get_stations_colnames(FILENAME:str = 'station_core_columns_dtypes.yaml'):
     """
     Retrieves column names for stations from a configuration file.
@@ -84,9 +148,8 @@ def get_stations_colnames(FILENAME:str = 'station_core_columns_dtypes.yaml'):
     - This function facilitates dynamic loading of station column names based on a configuration file,
       allowing for flexibility in defining station data structures in the application.
     """
-    CONFIG_DIRPATH = st.session_state['APP']['CONFIG']['CONFIG_DIRPATH']
-    STATION_CORE_COLUMNS_DTYPES = load_yaml(os.path.join(CONFIG_DIRPATH, FILENAME))
-    station_colnames_mapping = colnames_dtype_mapping(STATION_CORE_COLUMNS_DTYPES)
+    CONFIG_DIRPATH, _ = _config()
+    station_colnames_mapping = _load_dtype_mapping(CONFIG_DIRPATH, FILENAME)
     return station_colnames_mapping
 
 
@@ -111,18 +174,15 @@ def create_videos_dataframe():
     - This function facilitates dynamic creation of a DataFrame structure for videos based on a 
       configuration file, allowing for flexibility in defining video data structures in the application.
     """
-    CONFIG_DIRPATH = st.session_state['APP']['CONFIG']['CONFIG_DIRPATH']
-    DTYPES = st.session_state['APP']['CONFIG']['DTYPES']
+    CONFIG_DIRPATH, DTYPES = _config()
 
-    VIDEO_CORE_COLUMNS_DTYPES = load_yaml(os.path.join(CONFIG_DIRPATH, DTYPES['VIDEO_CORE_COLUMNS_DTYPES']))
-    dtype_mapping = colnames_dtype_mapping(VIDEO_CORE_COLUMNS_DTYPES)
-    df = pd.DataFrame(columns=dtype_mapping.keys(), ).astype(dtype_mapping)
+    dtype_mapping = _load_dtype_mapping(CONFIG_DIRPATH, DTYPES['VIDEO_CORE_COLUMNS_DTYPES'])
+    df = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in dtype_mapping.items()})
     if "IN_VIDEOS_DIRPATH" not in df.columns:
         df["IN_VIDEOS_DIRPATH"] = False
     return df
 
 
-st.cache_data()
 def load_station_measurement_types():
     """
     Loads the data types of station measurements from a configuration file.
@@ -140,16 +200,34 @@ def load_station_measurement_types():
     Note:
     - The resulting dictionary provides a standardized way to handle data types for station measurements 
       throughout the application. This ensures consistent data processing and avoids data type-related errors.
-    - The `st.cache_data()` decorator ensures that this function uses cached results, reducing redundant 
-      IO operations and improving application performance.
+    - The yaml file is only read and parsed again after it changes on disk (see `_load_dtype_mapping`).
     """
-    CONFIG_DIRPATH = st.session_state['APP']['CONFIG']['CONFIG_DIRPATH']
-    DTYPES = st.session_state['APP']['CONFIG']['DTYPES']
-    STATION_MEASUREMENT_COLUMNS_DTYPES = load_yaml(os.path.join(CONFIG_DIRPATH, DTYPES['STATION_MEASUREMENT_COLUMNS_DTYPES']))
-    dtype_mapping= colnames_dtype_mapping(STATION_MEASUREMENT_COLUMNS_DTYPES)
+    CONFIG_DIRPATH, DTYPES = _config()
+    dtype_mapping = _load_dtype_mapping(CONFIG_DIRPATH, DTYPES['STATION_MEASUREMENT_COLUMNS_DTYPES'])
     return dtype_mapping
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_measurement_options(path:str, mtime:float, size:int)->tuple:
+    """Sorted measurement column names and their dtype mapping, once per file version (`mtime`, `size`)."""
+    dtype_mapping = colnames_dtype_mapping(_cached_load_yaml(path, mtime, size))
+    return tuple(sorted(dtype_mapping)), dtype_mapping
+
+
+def _measurement_options()->tuple:
+    """
+    Optional station measurement types for the stations editor.
+
+    Returns:
+    - tuple: The sorted measurement column names, used as the multiselect options, and the
+      dictionary mapping them to their data types. Both are shared, do not modify them in place.
+    """
+    CONFIG_DIRPATH, DTYPES = _config()
+    path = os.path.join(CONFIG_DIRPATH, DTYPES['STATION_MEASUREMENT_COLUMNS_DTYPES'])
+    stat = os.stat(path)
+    return _cached_measurement_options(path, stat.st_mtime, stat.st_size)
+
+
 def error_callback(error:str):
     """
     Displays an error message on the Streamlit frontend.
@@ -228,9 +306,14 @@ def get_videos_per_station(
     _videos = {}
     if 'SELECTED' not in videos_df.columns:
         videos_df['SELECTED'] = False
-    for siteName, subset in videos_df.groupby(linking_key):
-        _videos[siteName] = dict(zip(subset[subset_col], subset['SELECTED']))       
-    return _videos
+    # Single pass over the three columns, no per-site groupby subsets
+    for siteName, fileName, selected in zip(videos_df[linking_key], videos_df[subset_col], videos_df['SELECTED']):
+        # rows without a site name are dropped, as `groupby` did
+        if pd.isna(siteName):
+            continue
+        _videos.setdefault(siteName, {})[fileName] = selected
+    # Sites sorted as `groupby` returned them, videos keep their row order
+    return {siteName: _videos[siteName] for siteName in sorted(_videos)}
 
 
 def create_data_editor(df:pd.DataFrame, key:str):
@@ -279,34 +362,6 @@ def create_data_editor(df:pd.DataFrame, key:str):
         raise ValueError(f'**`create_data_editor` exception occurred:** data_editor is None')
         
 
-def evaluate_sets(A, B):
-    """
-    Evaluate the difference between two sets, A and B.
-
-    Parameters:
-    - A (set): The first set.
-    - B (set): The second set.
-
-    Returns:
-    - set: If sets A and B are identical, an empty set is returned. 
-           Otherwise, the difference between sets A and B (i.e., elements in A that are not in B) is returned.
-
-    Example:
-    >>> evaluate_sets({1, 2, 3}, {3, 4, 5})
-    {1, 2}
-
-    >>> evaluate_sets({1, 2, 3}, {1, 2, 3})
-    set()
-
-    Notes:
-    - The function does not handle cases where the input is not of type 'set'.
-    """
-    if A == B:
-        return set()  # Return an empty set if sets A and B are equal
-    else:
-        return A - B  # Return the difference between sets A and B
-
-
 def build_survey_stations(SURVEY_NAME:str = None, stations_dict:dict = None):
     """
     Build a pandas DataFrame representing survey stations based on a given survey name and an optional stations dictionary.
@@ -329,7 +384,7 @@ def build_survey_stations(SURVEY_NAME:str = None, stations_dict:dict = None):
     (Add appropriate examples showcasing the function's behavior)
 
     Notes:
-    - The function assumes the existence of auxiliary functions like 'get_stations_colnames', 'load_station_measurement_types', etc.
+    - The function assumes the existence of auxiliary functions like 'get_stations_colnames', '_measurement_options', etc.
     - The function may reinitialize the DataFrame when adding or removing optional columns.
 
     Warnings:
@@ -343,27 +398,26 @@ def build_survey_stations(SURVEY_NAME:str = None, stations_dict:dict = None):
 
         if stations_dict is not None and stations_colnames is not None and len(stations_colnames)>0:
             # Hack to ensure you get the same order in the columns
-            first_station = next(iter(stations_dict))
-            saved_colnames = set(stations_dict[first_station].keys())
-            difference_colnames = sorted(list(evaluate_sets(saved_colnames, set(stations_colnames.keys()))))            
+            # Columns saved in any station, stations may not all share the same optional columns
+            saved_colnames = set().union(*(stations_dict.values()))
+            difference_colnames = sorted(saved_colnames - set(stations_colnames))            
             columns_to_add = list(stations_colnames.keys()) + difference_colnames 
-            stations_df = pd.DataFrame.from_dict(stations_dict, orient='index', columns=columns_to_add)
-            stations_df.reset_index(inplace=True, drop=True)
+            # Columnar build, no orient='index' transpose nor reset_index copy
+            stations_df = pd.DataFrame({col: [station.get(col) for station in stations_dict.values()] for col in columns_to_add})
 
         else:
-            stations_df = pd.DataFrame(columns=stations_colnames.keys(), ).astype(stations_colnames)
-            measurement_colnames_dtypes = load_station_measurement_types()
+            measurement_options, measurement_colnames_dtypes = _measurement_options()
             selected_optional_measurements = st.multiselect(
                 '**Select optional measurement types:**',
-                options=sorted(measurement_colnames_dtypes.keys()),                    
+                options=measurement_options,                    
                 format_func=lambda x: x.replace('measurementType__',''))
                     
-            if selected_optional_measurements:
-                _dtype_mapping =  {k: measurement_colnames_dtypes[k] for k in selected_optional_measurements}
-                # The core columns are added first, then the optional columns are added. It will always result in an empty dataframe.
-                # WARNING: The  the dataframe is reinitialized from empty to add or remove the optional columns. Every time the optional columns are added or deleted, the dataframe is reinitialized.
-                # workflow: add or remove extra columns then add data to the dataframe.
-                stations_df = pd.concat([stations_df, pd.DataFrame(columns= sorted(_dtype_mapping.keys()), ).astype(_dtype_mapping)], axis=1)
+            # The core columns are added first, then the optional columns are added. It will always result in an empty dataframe.
+            # WARNING: The  the dataframe is reinitialized from empty to add or remove the optional columns. Every time the optional columns are added or deleted, the dataframe is reinitialized.
+            # workflow: add or remove extra columns then add data to the dataframe.
+            _dtype_mapping = {**stations_colnames, **{k: measurement_colnames_dtypes[k] for k in sorted(selected_optional_measurements)}}
+            # Built once from the merged dtypes, no concat of empty frames
+            stations_df = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in _dtype_mapping.items()})
         if stations_df is not None:
             return stations_df
         
@@ -440,8 +494,8 @@ def flatten_and_create_dataframe(input_dict, VIDEOS_DIRPATH:str, columns = ["sit
     Workflow:
     - Iterate over the outer and inner dictionaries to extract the site name, file name, and selection value.
     - If the selected value is None, default to False.
-    - Append the flattened data as a tuple to the flattened_data list.
-    - Convert the flattened_data list into a DataFrame using the provided columns.
+    - Append the site name, file name and local availability to one list per column.
+    - Build the DataFrame from the column lists, named with the provided columns.
 
     Example:
     >>> data = {
@@ -460,23 +514,22 @@ def flatten_and_create_dataframe(input_dict, VIDEOS_DIRPATH:str, columns = ["sit
     Notes:
     - This function is useful when there's a need to work with flattened structures, especially in data analysis or visualization tasks.
     """
-    flattened_data = []
-    LOCAL_VIDEOS = get_files_dictionary(
-        VIDEOS_DIRPATH, 
-        file_extension=VIDEOS_FILE_EXTENSION,
-        keep_extension_in_key=True)
+    # Nothing to flatten, skip the videos directory listing
+    if not input_dict:
+        return pd.DataFrame(columns=columns)
 
-    for site_name, files_info in input_dict.items():
-        for file_name, selected_value in files_info.items():
-            if file_name in LOCAL_VIDEOS:
-                is_in_videos_dirpath = True
-            else:
-                is_in_videos_dirpath = False
+    site_names, file_names, in_videos_dirpath = [], [], []
+    LOCAL_VIDEOS = _get_files_dictionary(VIDEOS_DIRPATH, file_extension=VIDEOS_FILE_EXTENSION)
 
+    for site_name, files_info in input_dict.items():
+        for file_name in files_info:
             #selected = selected_value if selected_value is not None else False
-            flattened_data.append((site_name, file_name, is_in_videos_dirpath))
+            site_names.append(site_name)
+            file_names.append(file_name)
+            in_videos_dirpath.append(file_name in LOCAL_VIDEOS)
     
-    df = pd.DataFrame(flattened_data, columns=columns)
+    # dict-of-columns constructor, no intermediate row tuples
+    df = pd.DataFrame(dict(zip(columns, (site_names, file_names, in_videos_dirpath))))
     return df
 
 def partially_reset_session(keep_keys: list = ['CONFIG', 'SURVEY']):
@@ -490,26 +543,24 @@ def partially_reset_session(keep_keys: list = ['CONFIG', 'SURVEY']):
     - None: This function does not return anything but modifies the session state in place.
 
     Workflow:
-    - Fetch the current keys from the 'APP' key within the session state.
-    - Iterate over each key in the 'APP' key's value.
-    - If the key is not in the list of keys to keep (keep_keys), reset its value to an empty dictionary.
+    - Fetch the current 'APP' dictionary from the session state once.
+    - Rebuild it with every key not in the list of keys to keep (keep_keys) reset to an empty dictionary.
+    - Assign the rebuilt dictionary back to the 'APP' key in a single session state write.
 
     Dependencies:
     - Requires Streamlit (as st) to be imported.
 
     Notes:
     - This function is useful when there's a need to clear out specific session data but retain certain configuration or survey data.
+    - The 'APP' dictionary is replaced, not modified in place. References to the previous 'APP' dictionary are not reset.
     - Modifying the session state directly may affect the app's behavior. Use with caution and ensure the intended keys are passed to the 'keep_keys' parameter.
 
     Example Usage in Streamlit App:
     >>> partially_reset_session(keep_keys=['CONFIG'])
     (This will reset all keys under st.session_state['APP'] except for 'CONFIG'.)
     """
-    APP_KEYS = st.session_state['APP'].keys()
-
-    for key in APP_KEYS:
-        if key not in keep_keys:
-            st.session_state['APP'][key] = {}
+    APP = st.session_state['APP']
+    st.session_state['APP'] = {key: (APP[key] if key in keep_keys else {}) for key in list(APP)}
 
 
 
@@ -546,7 +597,7 @@ def survey_selector_box(SURVEYS_AVAILABLE:dict, index:int = 0, format_func: call
     - The function assumes Streamlit is running, and the selectbox will be rendered as part of an active Streamlit app.
     """
     if SURVEYS_AVAILABLE is not None and len(SURVEYS_AVAILABLE)>0:
-        SURVEYS_OPTIONS = sorted(list(SURVEYS_AVAILABLE.keys()))
+        SURVEYS_OPTIONS = sorted(SURVEYS_AVAILABLE)
 
         
         SURVEY_NAME = st.selectbox(
@@ -562,6 +613,11 @@ def survey_selector_box(SURVEYS_AVAILABLE:dict, index:int = 0, format_func: call
         st.session_state['SURVEY_INDEX'] = SURVEY_INDEX
         
         SURVEY_FILEPATH = SURVEYS_AVAILABLE[SURVEY_NAME]
+        CURRENT = st.session_state['CURRENT']
+        # Unchanged selection, nothing to write back
+        if CURRENT.get('SURVEY_NAME', None) == SURVEY_NAME and CURRENT.get('SURVEY_FILEPATH', None) == SURVEY_FILEPATH and CURRENT.get('SURVEY_INDEX', None) == SURVEY_INDEX:
+            return SURVEY_NAME, SURVEY_FILEPATH
+
         st.session_state['CURRENT']['SURVEY_INDEX'] = SURVEY_INDEX
         st.session_state['CURRENT']['SURVEY_NAME'] = SURVEY_NAME
         st.session_state['CURRENT']['SURVEY_FILEPATH'] = SURVEY_FILEPATH
@@ -573,6 +629,14 @@ def survey_selector_box(SURVEYS_AVAILABLE:dict, index:int = 0, format_func: call
     else:
         return None
 
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _load_image(path:str, mtime:float)->Image.Image:
+    """Decodes a frame image once per file version (`mtime`). The image is shared across reruns, do not modify it in place."""
+    image = Image.open(path)
+    image.load()
+    return image
+
+
 def display_image_carousel(image_paths_dict: dict, RANDOM_FRAMES:dict = {}):
     """
     Display an image carousel with navigation slider.
@@ -615,8 +679,8 @@ def display_image_carousel(image_paths_dict: dict, RANDOM_FRAMES:dict = {}):
         # Load and display the selected image
         if os.path.exists(selected_image_path):
                 
-            image = Image.open(selected_image_path)
-            # Open the selected image file
+            image = _load_image(selected_image_path, os.path.getmtime(selected_image_path))
+            # Open the selected image file, decoded once per file version
 
             st.image(image, caption=f'Frame {FRAME_NUMBER} | KEY: {selected_image_title}', use_column_width=True)
             # Display the image with its caption
@@ -629,6 +693,24 @@ def display_image_carousel(image_paths_dict: dict, RANDOM_FRAMES:dict = {}):
 
 
 
+def _new_random_frame(FRAME_FILEPATH:str)->dict:
+    """Empty interpretation entry for a newly selected random frame, with 10 dotpoints not yet started."""
+    return {
+        'FILEPATH': FRAME_FILEPATH,
+        'INTERPRETATION': {
+            'DOTPOINTS': { str(i).zfill(3): {
+                "DOTPOINT_ID": None,
+                "TAXONS": {},
+                "SUBSTRATE": None,
+                'frame_x_coord': None,
+                'frame_y_coord': None,
+
+                }  for i in range(1, 11)}, 
+            'STATUS': "NOT_STARTED"
+        }, 
+        }
+
+
 def show_random_frames(
         VIDEO_NAME:str, 
         STATION_NAME:str,
@@ -666,17 +748,36 @@ def show_random_frames(
 
     FRAMES_DIRPATH = STATION_DATA['BENTHOS_INTERPRETATION'].get('FRAMES_DIRPATH', None)
         
-    AVAILABLE_FRAMES = get_files_dictionary(
-        FRAMES_DIRPATH, 
-        file_extension='png', 
-        keep_extension_in_key=True)
+    # The SEC_xxxxxx keyed frames are kept in session state until the frames directory changes
+    FRAMES_KEY = (FRAMES_DIRPATH, os.path.getmtime(FRAMES_DIRPATH)) if FRAMES_DIRPATH is not None and os.path.isdir(FRAMES_DIRPATH) else None
+    FRAMES_CACHE = st.session_state.get('_FRAMES_CACHE', None)
+    if FRAMES_KEY is not None and FRAMES_CACHE is not None and FRAMES_CACHE['key'] == FRAMES_KEY:
+        AVAILABLE_FRAMES = FRAMES_CACHE['data']
+    else:
+        AVAILABLE_FRAMES = _get_files_dictionary(FRAMES_DIRPATH, file_extension='png')
+        if AVAILABLE_FRAMES is not None and len(AVAILABLE_FRAMES)>0:
+            # NEW:
+            # Keyed by SEC_xxxxxx, files that are not extracted frames are skipped
+            _FRAMES = {}
+            for filename in sorted(AVAILABLE_FRAMES):
+                match = _SEQ_RE.search(filename)
+                if match:
+                    _FRAMES[f"SEC_{match.group(1)}"] = AVAILABLE_FRAMES[filename]
+            AVAILABLE_FRAMES = _FRAMES
+            if FRAMES_KEY is not None:
+                st.session_state['_FRAMES_CACHE'] = {'key': FRAMES_KEY, 'data': AVAILABLE_FRAMES}
+
     if AVAILABLE_FRAMES is not None and len(AVAILABLE_FRAMES)>0:
-        # NEW:
-        AVAILABLE_FRAMES = {extract_sequence(filename): AVAILABLE_FRAMES[filename] for filename in sorted(AVAILABLE_FRAMES.keys())}
         # Aqui esta el error
         RANDOM_FRAMES = STATION_DATA['BENTHOS_INTERPRETATION'].get('RANDOM_FRAMES', None)
-        st.session_state['RANDOM_FRAMES_IDS'] = list(RANDOM_FRAMES.keys())
         _VIDEO_NAME = STATION_DATA['BENTHOS_INTERPRETATION'].get('VIDEO_NAME', None)            
+        # The picks live in session state and survive a frames range change. They are seeded, kept sorted,
+        # from the saved random frames only when the station, its video or the saved selection change
+        SAVED_FRAMES_IDS = sorted(RANDOM_FRAMES or {})
+        PICKS_KEY = (STATION_NAME, _VIDEO_NAME, tuple(SAVED_FRAMES_IDS))
+        if st.session_state.get('_RANDOM_FRAMES_PICKS_KEY', None) != PICKS_KEY:
+            st.session_state['RANDOM_FRAMES_IDS'] = SAVED_FRAMES_IDS
+            st.session_state['_RANDOM_FRAMES_PICKS_KEY'] = PICKS_KEY
         if _VIDEO_NAME == VIDEO_NAME and RANDOM_FRAMES is not None and len(RANDOM_FRAMES)>0:
             show_station_is_ready = True
             is_ready_for_interpretation = False
@@ -693,13 +794,33 @@ def show_random_frames(
                
                 fco1, fcol4 = st.columns([3,1])
                 with fco1:
+                    # Saved frames whose files were removed or re-extracted cannot be offered nor converted
+                    MISSING_FRAMES_IDS = [k for k in st.session_state['RANDOM_FRAMES_IDS'] if k not in AVAILABLE_FRAMES]
+                    if len(MISSING_FRAMES_IDS) > 0:
+                        st.warning(f'Frame(s) **{", ".join(MISSING_FRAMES_IDS)}** not found in the frames directory, removed from the selection.')
+                        st.session_state['RANDOM_FRAMES_IDS'] = [k for k in st.session_state['RANDOM_FRAMES_IDS'] if k in AVAILABLE_FRAMES]
+                    
+                    FRAMES_OPTIONS = list(AVAILABLE_FRAMES)
+                    # Long videos: the frames are offered one range at a time, the selected frames are always kept as options
+                    if len(FRAMES_OPTIONS) > _FRAMES_WINDOW_SIZE:
+                        FRAMES_WINDOWS = [FRAMES_OPTIONS[i:i+_FRAMES_WINDOW_SIZE] for i in range(0, len(FRAMES_OPTIONS), _FRAMES_WINDOW_SIZE)]
+                        FRAMES_WINDOW_INDEX = st.selectbox(
+                            label='**frames range:**',
+                            options=range(len(FRAMES_WINDOWS)),
+                            format_func=lambda i: f'{FRAMES_WINDOWS[i][0]} - {FRAMES_WINDOWS[i][-1]}',
+                            help=f'Frames are listed {_FRAMES_WINDOW_SIZE} at a time. Select the range of frames to pick from.',
+                            )
+                        FRAMES_OPTIONS = sorted({*st.session_state['RANDOM_FRAMES_IDS'], *FRAMES_WINDOWS[FRAMES_WINDOW_INDEX]})
+
                     RANDOM_FRAMES_IDS = st.multiselect(
                     label='**random frames:**',
-                        options=AVAILABLE_FRAMES.keys(),
-                        default=sorted(st.session_state.get('RANDOM_FRAMES_IDS', None)), 
+                        options=FRAMES_OPTIONS,
+                        default=st.session_state.get('RANDOM_FRAMES_IDS', None) or [], 
                         max_selections=10,
+                        key='random_frames_multiselect',
                         help='Select 10 random frames for interpretation.',                        
                         )
+                    RANDOM_FRAMES_IDS = sorted(RANDOM_FRAMES_IDS)
                     st.session_state['RANDOM_FRAMES_IDS'] = RANDOM_FRAMES_IDS
                     if len(RANDOM_FRAMES_IDS) < 10:
                         st.warning(f'Less than 10 frames selected. Requirement is 10 frames. Select {10-len(RANDOM_FRAMES_IDS)} more frame(s).')
@@ -711,24 +832,15 @@ def show_random_frames(
 
                     else:
                         show_station_is_ready = True
-                        RANDOM_FRAMES = {k: {
-                            'FILEPATH': AVAILABLE_FRAMES[k],
-                            'INTERPRETATION': {
-                                'DOTPOINTS': { str(i).zfill(3): {
-                                    "DOTPOINT_ID": None,
-                                    "TAXONS": {},
-                                    "SUBSTRATE": None,
-                                    'frame_x_coord': None,
-                                    'frame_y_coord': None,
-
-                                    }  for i in range(1, 11)}, 
-                                'STATUS': "NOT_STARTED"
-                            }, 
-                            } for k in RANDOM_FRAMES_IDS}
+                        # Rebuilt only when the selection changes, frames kept in the selection keep their interpretation.
+                        # Automatically selected frames are stored without an interpretation entry and always get one.
+                        INTERPRETED_FRAMES = {k: v for k, v in RANDOM_FRAMES.items() if isinstance(v, dict) and 'INTERPRETATION' in v}
+                        if frozenset(RANDOM_FRAMES_IDS) != frozenset(INTERPRETED_FRAMES) or st.session_state['CURRENT'].get('VIDEO_NAME', None) != _VIDEO_NAME:
+                            RANDOM_FRAMES = {k: INTERPRETED_FRAMES[k] if k in INTERPRETED_FRAMES else _new_random_frame(AVAILABLE_FRAMES[k]) for k in RANDOM_FRAMES_IDS}
                         
-                        STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES'] = RANDOM_FRAMES
-                        st.session_state['CURRENT']['VIDEO_NAME'] = _VIDEO_NAME                        
-                        update_station_data(st.session_state['CURRENT'], st.session_state['CURRENT_FILEPATH']) 
+                            STATION_DATA['BENTHOS_INTERPRETATION']['RANDOM_FRAMES'] = RANDOM_FRAMES
+                            # Kept in memory only, the current cache file is written once by the ready button.
+                            st.session_state['CURRENT']['VIDEO_NAME'] = _VIDEO_NAME
 
 
                 # --------------------        
@@ -743,14 +855,14 @@ def show_random_frames(
                             STATION_DATA['BENTHOS_INTERPRETATION']['IS_READY'] = is_ready_for_interpretation
                             st.session_state['CURRENT']['IS_READY'] = is_ready_for_interpretation
 
+                            st.session_state['CURRENT']['STATION_DATA'] = STATION_DATA
+                            # Station file and current cache file are saved together, once, before leaving the page.
                             with st.spinner():
                                 update_station_data(
                                     STATION_DATA=STATION_DATA,
                                     STATION_FILEPATH=STATION_FILEPATH,
                                 )
-                            
-                            st.session_state['CURRENT']['STATION_DATA'] = STATION_DATA
-                            update_station_data(st.session_state['CURRENT'], st.session_state['CURRENT_FILEPATH']) 
+                                update_station_data(st.session_state['CURRENT'], st.session_state['CURRENT_FILEPATH'])
                             
                             
                             st.toast('go to **MENU > Benthos interpretation**')                            
@@ -781,7 +893,33 @@ def show_random_frames(
     return is_ready_for_interpretation, STATION_DATA
 
 
-st.cache_data()
+@st.cache_data(show_spinner=False)
+def _cached_video_info(video_filepath:str, mtime:float, size:int)->dict:
+    """`get_video_info` of a video file, probed once per file version (`mtime`, `size`)."""
+    from bgstools.io.media import get_video_info
+    return get_video_info(video_filepath)
+
+
+def _get_video_info(video_filepath:str)->dict:
+    """
+    Retrieves the video information (codec, duration, ...) of a local video file.
+
+    Parameters:
+    - video_filepath (str): Path to the local video file.
+
+    Returns:
+    - dict: The video information as returned by `bgstools.io.media.get_video_info`.
+
+    Note:
+    - The probe result is cached per file version, re-encoding or replacing the file probes it again.
+    """
+    if not os.path.isfile(video_filepath):
+        from bgstools.io.media import get_video_info
+        return get_video_info(video_filepath)
+    stat = os.stat(video_filepath)
+    return _cached_video_info(video_filepath, stat.st_mtime, stat.st_size)
+
+
 def show_video_player(video_player: st.empty, LOCAL_VIDEO_FILEPATH:str, START_TIME_IN_SECONDS:int = 0):
     """
     Display a video player in a Streamlit application starting from a specific time.
@@ -794,7 +932,7 @@ def show_video_player(video_player: st.empty, LOCAL_VIDEO_FILEPATH:str, START_TI
     Notes:
     - The function assumes that it's being run within an active Streamlit application.
     - Utilizes Streamlit's native video function to render the video player.
-    - Uses the `st.cache_data()` decorator to cache the data, enhancing the function's performance by avoiding redundant computations.
+    - The player is a Streamlit element, it is rendered on every call and is not cached.
 
     Example:
         >>> video_space = st.empty()
@@ -823,6 +961,8 @@ def save_stations(STATIONS:dict, VIDEOS:dict, SURVEY_DIRPATH:str, fileExtension:
         fileExtension = '.' + fileExtension
 
     STATIONS_FILEPATHS = {}
+    # STATION_FILEPATH -> station document, written together once every station is merged
+    STATIONS_TO_WRITE = {}
 
     
     with st. spinner('Saving station data...'):
@@ -859,9 +999,13 @@ def save_stations(STATIONS:dict, VIDEOS:dict, SURVEY_DIRPATH:str, fileExtension:
                 else:
                     updated_station = station
                 
-                # Save the station data to a file.
-                with open(STATION_FILEPATH, 'w', encoding='utf-8') as f:
-                    yaml.safe_dump(updated_station, f, allow_unicode=True)
+                STATIONS_TO_WRITE[STATION_FILEPATH] = updated_station
+
+        # Save the station data to files back to back, with the same LibYAML emitter as the other station writes.
+        # Loading and merging every station happens before the first write, the writes themselves are not
+        # transactional: a failing write leaves the stations written before it updated.
+        for STATION_FILEPATH, updated_station in STATIONS_TO_WRITE.items():
+            update_station_data(STATION_DATA=updated_station, STATION_FILEPATH=STATION_FILEPATH)
 
     
     if len(STATIONS_FILEPATHS)>0:
@@ -874,6 +1018,45 @@ def save_stations(STATIONS:dict, VIDEOS:dict, SURVEY_DIRPATH:str, fileExtension:
 
     
 
+def _survey_save_signature(SURVEY_DATA:dict, SURVEY_FILEPATH:str)->tuple:
+    """
+    Fingerprint of the survey data to be written to disk.
+
+    Parameters:
+    - SURVEY_DATA (dict): The survey data dictionary to be saved.
+    - SURVEY_FILEPATH (str): The survey YAML filepath.
+
+    Returns:
+    - tuple: The filepath and a digest of the data (see `data_digest`), independent of the dictionary insertion order.
+    """
+    return (SURVEY_FILEPATH, data_digest(SURVEY_DATA))
+
+
+def _file_mtime(filepath:str)->float:
+    """Modification time of a file, or None when it does not exist."""
+    return os.path.getmtime(filepath) if filepath is not None and os.path.isfile(filepath) else None
+
+
+@st.cache_data(show_spinner=False)
+def _load_stations_bundle(stations_files:tuple)->tuple:
+    """
+    Loads the metadata and videos of every station file in a single pass.
+
+    Parameters:
+    - stations_files (tuple): (station name, station filepath, modification time) for each station. The
+      modification times are part of the cache key, saving a station file reloads the bundle.
+
+    Returns:
+    - tuple: Two dictionaries keyed by station name, the stations METADATA and the stations VIDEOS.
+    """
+    STATIONS, VIDEOS = {}, {}
+    for station, filepath, _ in stations_files:
+        STATION_DATA = load_yaml(filepath)
+        STATIONS[station] = STATION_DATA['METADATA']
+        VIDEOS[station] = STATION_DATA['VIDEOS']
+    return STATIONS, VIDEOS
+
+
 def survey_data_editor(SURVEY_DATA:dict, SURVEY_DATASTORE:DataStore, SURVEY_FILEPATH:str)->bool:
     """
     Interactive data editor in Streamlit for editing and saving survey data.
@@ -917,8 +1100,8 @@ def survey_data_editor(SURVEY_DATA:dict, SURVEY_DATASTORE:DataStore, SURVEY_FILE
         #STATIONS_FILEPATHS = SURVEY_DATA.get('STATIONS_FILEPATHS', {})
         
         if len(STATIONS_FILEPATHS) >0:
-            _STATIONS = {station: load_yaml(filepath)['METADATA'] for station, filepath in STATIONS_FILEPATHS.items()}
-            _VIDEOS = {station: load_yaml(filepath)['VIDEOS'] for station, filepath in STATIONS_FILEPATHS.items()}
+            _STATIONS, _VIDEOS = _load_stations_bundle(
+                tuple((station, filepath, os.path.getmtime(filepath)) for station, filepath in STATIONS_FILEPATHS.items()))
         else:
             _STATIONS = {}
             _VIDEOS = {}
@@ -942,28 +1125,26 @@ def survey_data_editor(SURVEY_DATA:dict, SURVEY_DATASTORE:DataStore, SURVEY_FILE
 
         if _STATIONS is not None and len(_STATIONS) >=1 and len(stations_colnames)>0:
             # Hack to ensure you get the same order in the columns
-            first_station = next(iter(_STATIONS))
-            saved_colnames = set(_STATIONS[first_station].keys())
-            difference_colnames = sorted(list(evaluate_sets(saved_colnames, set(stations_colnames.keys()))))            
+            # Columns saved in any station, stations may not all share the same optional columns
+            saved_colnames = set().union(*(_STATIONS.values()))
+            difference_colnames = sorted(saved_colnames - set(stations_colnames))            
             columns_to_add = list(stations_colnames.keys()) + difference_colnames 
-            stations_df = pd.DataFrame.from_dict(_STATIONS, orient='index', columns=columns_to_add)
-            stations_df.reset_index(inplace=True, drop=True)
+            # Columnar build, no orient='index' transpose nor reset_index copy
+            stations_df = pd.DataFrame({col: [station.get(col) for station in _STATIONS.values()] for col in columns_to_add})
 
         else:
 
-            stations_df = pd.DataFrame(columns=stations_colnames.keys(), ).astype(stations_colnames)
-            measurement_colnames_dtypes = load_station_measurement_types()
+            measurement_options, measurement_colnames_dtypes = _measurement_options()
             selected_optional_measurements = st.multiselect(
                 '**Select optional measurement types:**',
-                options=sorted(measurement_colnames_dtypes.keys()),                    
+                options=measurement_options,                    
                 format_func=lambda x: x.replace('measurementType__',''))
-                    
-            if selected_optional_measurements:
-                _dtype_mapping =  {k: measurement_colnames_dtypes[k] for k in selected_optional_measurements}
-                # The core columns are added first, then the optional columns are added. It will always result in an empty dataframe.
-                # WARNING: The  the dataframe is reinitialized from empty to add or remove the optional columns. Every time the optional columns are added or deleted, the dataframe is reinitialized.
-                # workflow: add or remove extra columns then add data to the dataframe.
-                stations_df = pd.concat([stations_df, pd.DataFrame(columns= sorted(_dtype_mapping.keys()), ).astype(_dtype_mapping)], axis=1)
+            # The core columns are added first, then the optional columns are added. It will always result in an empty dataframe.
+            # WARNING: The  the dataframe is reinitialized from empty to add or remove the optional columns. Every time the optional columns are added or deleted, the dataframe is reinitialized.
+            # workflow: add or remove extra columns then add data to the dataframe.
+            _dtype_mapping = {**stations_colnames, **{k: measurement_colnames_dtypes[k] for k in sorted(selected_optional_measurements)}}
+            # Built once from the merged dtypes, no concat of empty frames
+            stations_df = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in _dtype_mapping.items()})
 
         # --------------------
         
@@ -1038,7 +1219,12 @@ def survey_data_editor(SURVEY_DATA:dict, SURVEY_DATASTORE:DataStore, SURVEY_FILE
             
             with st.spinner('Saving survey data...'):
                 try:
-                    SURVEY_DATASTORE.store_data({'APP': SURVEY_DATA})                    
+                    # Skip re-serializing the whole survey when nothing changed since the last save.
+                    # The file mtime is kept next to the signature, an external edit of the file forces the save
+                    SURVEY_SAVE_SIG = _survey_save_signature(SURVEY_DATA, SURVEY_FILEPATH)
+                    if st.session_state.get('_last_survey_save', None) != (SURVEY_SAVE_SIG, _file_mtime(SURVEY_FILEPATH)):
+                        SURVEY_DATASTORE.store_data({'APP': SURVEY_DATA})
+                        st.session_state['_last_survey_save'] = (SURVEY_SAVE_SIG, _file_mtime(SURVEY_FILEPATH))
                 except Exception as e:
                     st.error(f'**An exception ocurred saving the survey data:** {e}')                   
                 else:        
@@ -1115,6 +1301,9 @@ def show_video_processing(
     This function is specifically designed for use within a Streamlit app and may require modifications 
     if used in a different context.
     """
+    # Imported here, the media helpers are only needed once a station video is processed
+    from bgstools.io.media import convert_codec
+
     STATION_DIRPATH = os.path.dirname(STATION_FILEPATH)
 
     if SURVEY_DATA is not None and len(SURVEY_DATA)>0:
@@ -1129,7 +1318,7 @@ def show_video_processing(
                 
                 if LOCAL_VIDEO_FILEPATH is not None:
                     if VIDEO_NAME is not None:
-                        video_info= get_video_info(LOCAL_VIDEO_FILEPATH)
+                        video_info= _get_video_info(LOCAL_VIDEO_FILEPATH)
                         if video_info is not None:
                             codec = video_info['codec']
                         else:
@@ -1179,7 +1368,7 @@ def show_video_processing(
                                         _VIDEO_NAME = converted_video_filename
                                         _VIDEO_FILEPATH = converted_video_filepath
                                         _VIDEO_DIRPATH = os.path.dirname(_VIDEO_FILEPATH)
-                                        VIDEO_INFO = get_video_info(_VIDEO_FILEPATH)
+                                        VIDEO_INFO = _get_video_info(_VIDEO_FILEPATH)
                                         st.session_state['codec'] = VIDEO_INFO['codec']
                                                                                     
                                         VIDEO_INTERPRETATION = { 
@@ -1209,7 +1398,7 @@ def show_video_processing(
                                 VIDEO_FILEPATH = LOCAL_VIDEO_FILEPATH
                                 VIDEO_DIRPATH = os.path.dirname(VIDEO_FILEPATH)
 
-                                VIDEO_INFO = get_video_info(VIDEO_FILEPATH)
+                                VIDEO_INFO = _get_video_info(VIDEO_FILEPATH)
                                 st.session_state['codec'] = VIDEO_INFO['codec']
 
                                 VIDEO_INTERPRETATION = { 
@@ -1222,7 +1411,7 @@ def show_video_processing(
                                     'VIDEO_DIRPATH': VIDEO_DIRPATH,
                                     'VIDEO_INFO': VIDEO_INFO,}
                             
-                                STATION_DATA['VIDEOS'].update({VIDEO_NAME: True})
+                                STATION_DATA['VIDEOS'][VIDEO_NAME] = True
 
 
                                 STATION_DATA['BENTHOS_INTERPRETATION'].update(VIDEO_INTERPRETATION)
@@ -1433,12 +1622,13 @@ def main_menu():
             try:
                 # DATASTORE is initialized here
                 SURVEY_DATASTORE = load_datastore(survey_filepath=SURVEY_FILEPATH)
-                SURVEY_DATA = SURVEY_DATASTORE.storage_strategy.data.get('APP', {})
+                # The DataStore is shared by every rerun and session, edits go to a private copy until saved
+                SURVEY_DATA = copy.deepcopy(SURVEY_DATASTORE.storage_strategy.data.get('APP', {}))
                 SURVEY_DATA['SURVEY_INDEX'] = st.session_state['SURVEY_INDEX']
 
             except Exception as e:
                 #st.error(f'An error ocurred loading the survey data. Check the **<survey_file.yaml>** is not empty. If empty, please delete the file and its subdirectory and start a new survey. **{e}**')
-                st.error(traceback.print_exc())
+                st.error(traceback.format_exc())
                 SURVEY_DATA = {}
                 
             # --------------------
@@ -1471,10 +1661,7 @@ def main_menu():
                 
             VIDEOS_DIRPATH = SURVEY_DATA.get('SURVEY', {}).get('VIDEOS_DIRPATH', None)
             if VIDEOS_DIRPATH is not None and os.path.exists(VIDEOS_DIRPATH):                
-                LOCAL_VIDEOS = get_files_dictionary(
-                    VIDEOS_DIRPATH, 
-                    file_extension=VIDEOS_FILE_EXTENSION,
-                    keep_extension_in_key=True)
+                LOCAL_VIDEOS = _get_files_dictionary(VIDEOS_DIRPATH, file_extension=VIDEOS_FILE_EXTENSION)
                     
             # ---
             EXPECTED_VIDEOS = STATION_DATA.get('VIDEOS', {})
@@ -1506,7 +1693,7 @@ try:
     CURRENT_FILENAME = 'seams_current_cache_data.yaml'
     CURRENT_FILEPATH = os.path.join(DATA_DIRPATH, CURRENT_FILENAME)        
 
-    if CURRENT_FILENAME not in os.listdir(DATA_DIRPATH):
+    if not os.path.isfile(CURRENT_FILEPATH):
         st.warning('**Initializing survey data**.') 
         CURRENT = {}
         update_station_data(STATION_DATA=CURRENT, STATION_FILEPATH=CURRENT_FILEPATH)            
@@ -1560,8 +1747,5 @@ try:
     #run()
 
 except Exception as e:
-    trace_error = traceback.print_exc()
-    if trace_error is None:
-        trace_error= ''
-    else:        
-        st.error(f'**Survey initializaton exception:** {trace_error} {e} | **Refresh the app and try again**')
\ No newline at end of file
+    trace_error = traceback.format_exc()
+    st.error(f'**Survey initializaton exception:** {trace_error} {e} | **Refresh the app and try again**')
\ No newline at end of file
@@ -0,0 +1,52 @@
+import os
+import sys
+import unittest
+
+# The app modules use flat imports, e.g. `from seams_utils import ...`
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'seams_app'))
+
+from seams_utils import station_fingerprint
+
+
+def build_station_data(taxons:dict)->dict:
+    return {
+        'BENTHOS_INTERPRETATION': {
+            'RANDOM_FRAMES': {
+                'SEC_000010': {'INTERPRETATION': {'DOTPOINTS': {
+                    '1': {'SUBSTRATE': 'Sand', 'TAXONS': taxons},
+                    }}},
+                },
+            },
+        'SUBSTRATES': {'Sand': True},
+        'TAXONS': {'x': True},
+        }
+
+
+class TestStationFingerprint(unittest.TestCase):
+
+    def test_none_taxon_key(self):
+        # Blank rows of the taxons data editor save a None key, the Results table skips it
+        fingerprint = station_fingerprint(
+            build_station_data({None: True, 'x': True}), ('SEC_000010',), names=('SURVEY', 'STATION', 'VIDEO'), centroids_xy={1: (10.5, 20.25)})
+        expected = station_fingerprint(
+            build_station_data({'x': True}), ('SEC_000010',), names=('SURVEY', 'STATION', 'VIDEO'), centroids_xy={1: (10.5, 20.25)})
+        self.assertEqual(fingerprint, expected)
+
+    def test_key_order(self):
+        self.assertEqual(
+            station_fingerprint(build_station_data({'x': True, 'y': True}), ('SEC_000010',)),
+            station_fingerprint(build_station_data({'y': True, 'x': True}), ('SEC_000010',)))
+
+    def test_changed_dotpoint(self):
+        self.assertNotEqual(
+            station_fingerprint(build_station_data({'x': True}), ('SEC_000010',)),
+            station_fingerprint(build_station_data({'x': False}), ('SEC_000010',)))
+
+    def test_changed_centroids(self):
+        self.assertNotEqual(
+            station_fingerprint(build_station_data({'x': True}), ('SEC_000010',), centroids_xy={1: (10.5, 20.25)}),
+            station_fingerprint(build_station_data({'x': True}), ('SEC_000010',), centroids_xy={1: (10.0, 20.25)}))
+
+
+if __name__ == '__main__':
+    unittest.main()